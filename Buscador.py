@@ -1,25 +1,28 @@
 import os
 import sys
+import ctypes.wintypes
 import string
 import threading
 import subprocess
 import platform
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Sequence
 import win32file
-from collections import defaultdict
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QListWidget, QLabel, QMessageBox, 
+    QPushButton, QLineEdit, QLabel, QMessageBox, 
     QFrame, QCompleter, QTextEdit
 )
-from PyQt5.QtCore import Qt, QTimer, QStringListModel, pyqtSignal, QObject
+from PyQt5.QtCore import Qt, QTimer, QModelIndex, QStringListModel, pyqtSignal, QObject
 from PyQt5.QtGui import QFont
 
 from ventana import VentanaBase
+from IndiceArchivos import IndiceArchivos
 from GestorHistorial import GestorHistorial
 from ventana_instrucciones import VentanaInstrucciones
 from lectores import leer_contenido_archivo as leer_contenido_archivo_factory
+from lectores import buscar_en_paralelo, LectorFactory, MAX_TAMANIO_CONTENIDO, MAX_HILOS_CONTENIDO
 
 
 # CONSTANTES
@@ -30,37 +33,59 @@ EXTENSIONES_TEXTO = {
 
 ENCODINGS_TEXTO = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
 
+# Sistema operativo, para elegir cómo abrir archivos (no cambia en ejecución)
+SISTEMA = platform.system()
+
+# Mensaje de Windows al conectar/desconectar dispositivos y sus eventos de interés
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+
 
 # SEÑALES
 class Signals(QObject):
     """Señales para comunicación thread-safe."""
     progreso_actualizado = pyqtSignal(int, int, int)
-    busqueda_finalizada = pyqtSignal(list, str)
+    busqueda_finalizada = pyqtSignal(object, list, str)
     error_busqueda = pyqtSignal(str)
-    indexacion_completa = pyqtSignal(int)
+    indexacion_completa = pyqtSignal(int, object)
 
 
 # FUNCIONES AUXILIARES
-def detectar_unidades_disponibles() -> List[Dict[str, str]]:
-    """Detecta unidades extraíbles USB."""
+def detectar_unidades_disponibles(mascara: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    Detecta unidades extraíbles USB.
+    
+    Args:
+        mascara: Máscara de GetLogicalDrives (bit 0 = A:, bit 1 = B:, ...).
+                 None = consultarla aquí
+    """
     import win32api
     unidades = []
     
-    for letra in string.ascii_uppercase:
+    if mascara is None:
+        mascara = win32file.GetLogicalDrives()
+    
+    for posicion, letra in enumerate(string.ascii_uppercase):
+        # Letras sin unidad montada: ni siquiera se consultan
+        if not mascara & (1 << posicion):
+            continue
+        
         unidad = f"{letra}:\\"
         
         if letra in ['A', 'B', 'C']:
             continue
         
-        if not os.path.exists(unidad):
-            continue
-        
         try:
             tipo_unidad = win32file.GetDriveType(unidad)
             
             if tipo_unidad not in [2, 3]:
                 continue
             
+            # Solo se pregunta por las candidatas (ej: lector de tarjetas sin tarjeta)
+            if not os.path.exists(unidad):
+                continue
+            
             # Obtener etiqueta del volumen
             try:
                 volume_info = win32api.GetVolumeInformation(unidad)
@@ -92,7 +117,8 @@ def leer_contenido_archivo(ruta: str) -> str:
 class BuscadorArchivos(VentanaBase):
     """Clase principal del buscador - Corregida sin duplicación."""
     
-    INTERVALO_DETECCION_USB = 3000
+    # Respaldo hasta recibir el primer WM_DEVICECHANGE; normalmente avisa Windows
+    INTERVALO_DETECCION_USB = 10000
     DELAY_BUSQUEDA_VIVO = 200
     MAX_ARCHIVOS_MOSTRADOS = 999999999
     UPDATE_INTERVAL = 2500
@@ -107,21 +133,21 @@ class BuscadorArchivos(VentanaBase):
         
         # Estado
         self.unidad_seleccionada = None
-        self.resultados = []
-        self.todos_los_archivos = []
+        # Los resultados son posiciones dentro de self.indice
+        self.resultados: Sequence[int] = []
+        self.indice = IndiceArchivos()
         self.unidades_previas = []
+        self.mascara_unidades = 0
         self.tipo_busqueda = self.BUSQUEDA_NOMBRE
         self.buscando_contenido = False
+        # Cambia con cada búsqueda por contenido; un hilo con otra generación
+        # quedó obsoleto y abandona los archivos pendientes
+        self.generacion_contenido = 0
         self.indexando = False
         
-        # Control de threads
-        self.thread_indexacion_activo = None
-        self.cancelar_indexacion = False
-        self.lock_indexacion = threading.Lock()
-        
-        # Índices para búsqueda ultra-rápida
-        self.indice_nombres = defaultdict(list)
-        self.indice_extensiones = defaultdict(list)
+        # Cada indexación recibe un número de generación; un hilo cuya
+        # generación ya no es la actual fue cancelado y descarta su trabajo
+        self.generacion_indexado = 0
         
         # Señales
         self.signals = Signals()
@@ -133,6 +159,8 @@ class BuscadorArchivos(VentanaBase):
         # Historial
         self.historial = GestorHistorial()
         self.completer = None
+        self.ventana_instrucciones = None
+        self.modelo_historial = None
         self.historial.limpiar()
         
         # Inicializar UI
@@ -155,7 +183,9 @@ class BuscadorArchivos(VentanaBase):
     def mostrar_ventana_instrucciones(self):
         """Muestra ventana de instrucciones."""
         try:
-            self.ventana_instrucciones = VentanaInstrucciones(self)
+            # Se crea una sola vez; al cerrarla solo se oculta y se vuelve a mostrar
+            if self.ventana_instrucciones is None:
+                self.ventana_instrucciones = VentanaInstrucciones(self)
             self.ventana_instrucciones.mostrar()
         except:
             pass
@@ -194,6 +224,10 @@ class BuscadorArchivos(VentanaBase):
                 }
             """)
             
+            # Modelo único: se asigna una vez y solo se actualizan sus datos
+            self.modelo_historial = QStringListModel(self.completer)
+            self.completer.setModel(self.modelo_historial)
+            
             self.search_input.setCompleter(self.completer)
             self.actualizar_completer()
         except Exception as e:
@@ -202,10 +236,8 @@ class BuscadorArchivos(VentanaBase):
     def actualizar_completer(self):
         """Actualiza completer."""
         try:
-            if self.completer:
-                model = QStringListModel()
-                model.setStringList(self.historial.obtener_todos())
-                self.completer.setModel(model)
+            if self.modelo_historial:
+                self.modelo_historial.setStringList(list(self.historial.obtener_todos()))
         except:
             pass
     
@@ -220,20 +252,13 @@ class BuscadorArchivos(VentanaBase):
             # Detectar tipo
             self._detectar_tipo_busqueda(texto)
             
-            # Actualizar historial
-            try:
-                coincidencias = self.historial.buscar_coincidencias(texto)
-                if self.completer:
-                    model = QStringListModel()
-                    model.setStringList(coincidencias)
-                    self.completer.setModel(model)
-            except:
-                pass
+            # El completer ya tiene todo el historial y lo filtra con
+            # MatchContains; no hace falta un modelo nuevo por tecla
             
             # Si vacío, mostrar todo
             if not texto.strip():
                 self.timer_autocompletar.stop()
-                if self.unidad_seleccionada and self.todos_los_archivos:
+                if self.unidad_seleccionada and len(self.indice):
                     QTimer.singleShot(50, self.mostrar_todos_los_archivos)
                 return
             
@@ -283,32 +308,53 @@ class BuscadorArchivos(VentanaBase):
             for info in unidades:
                 btn = QPushButton(info['texto'])
                 btn.setFixedHeight(60)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2B313F; 
-                        color: white;
-                        font-size: 20px;
-                        font-weight: bold;
-                        border: 2px solid #E32D64;
-                        border-radius: 15px;
-                    } 
-                    QPushButton:hover { 
-                        background-color: #4a4a4c; 
-                    }
-                    QPushButton:pressed {
-                        background-color: #E32D64;
-                    }
-                """)
+                # Estilo compartido en VentanaBase.HOJA_ESTILOS
+                btn.setObjectName("btn_unidad")
                 btn.setCursor(Qt.PointingHandCursor)
                 btn.clicked.connect(lambda _, i=info: self.seleccionar_unidad(i))
                 self.units_layout.addWidget(btn)
         except Exception as e:
             print(f"Error cargando unidades: {e}")
     
+    def nativeEvent(self, tipo_evento, mensaje):
+        """
+        Recibe los mensajes de Windows de la ventana.
+        
+        Al conectar o quitar una unidad, Windows envía WM_DEVICECHANGE a las
+        ventanas principales: la detección se hace en ese momento, sin
+        esperar al siguiente sondeo del timer. Con el primer aviso recibido
+        queda comprobado que llegan, y el timer de respaldo se detiene.
+        """
+        try:
+            if tipo_evento == b"windows_generic_MSG":
+                msg = ctypes.wintypes.MSG.from_address(int(mensaje))
+                if (msg.message == WM_DEVICECHANGE
+                        and msg.wParam in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE)):
+                    # Fuera del manejador nativo, en la próxima vuelta del event loop
+                    QTimer.singleShot(0, self.verificar_cambios_usb)
+                    
+                    # Los avisos llegan: ya no hace falta despertar cada pocos segundos
+                    if self.timer_usb.isActive():
+                        self.timer_usb.stop()
+        except Exception as e:
+            print(f"Error procesando mensaje de Windows: {e}")
+        
+        return super().nativeEvent(tipo_evento, mensaje)
+    
     def verificar_cambios_usb(self):
-        """Verifica cambios en USB."""
+        """
+        Verifica cambios en USB.
+        
+        Cada sondeo compara solo la máscara de GetLogicalDrives (una
+        llamada); la detección completa se hace únicamente si cambió.
+        """
         try:
-            actuales = detectar_unidades_disponibles()
+            mascara = win32file.GetLogicalDrives()
+            if mascara == self.mascara_unidades:
+                return
+            self.mascara_unidades = mascara
+            
+            actuales = detectar_unidades_disponibles(mascara)
             letras_actuales = {u['texto'] for u in actuales}
             letras_previas = {u['texto'] for u in self.unidades_previas}
             
@@ -317,14 +363,13 @@ class BuscadorArchivos(VentanaBase):
                     letra_seleccionada = self.unidad_seleccionada[0] + ":/"
                     
                     if letra_seleccionada not in letras_actuales:
-                        # Cancelar indexación si está en proceso
-                        self.cancelar_indexacion = True
+                        # Cancelar la indexación y la búsqueda en curso
+                        self.generacion_indexado += 1
+                        self._cancelar_busqueda_contenido()
                         
                         self.unidad_seleccionada = None
                         self.resultados = []
-                        self.todos_los_archivos = []
-                        self.indice_nombres.clear()
-                        self.indice_extensiones.clear()
+                        self.indice = IndiceArchivos()
                         self.indexando = False
                         self.mostrar_mensaje_inicial()
                 
@@ -338,57 +383,55 @@ class BuscadorArchivos(VentanaBase):
     def seleccionar_unidad(self, unidad: Dict[str, str]):
         """Selecciona unidad sin duplicar indexación."""
         try:
-            # Si ya está indexando, cancelar y esperar
-            if self.indexando:
-                print("Ya hay una indexacion en proceso, cancelando...")
-                self.cancelar_indexacion = True
-                
-                # Esperar a que termine el thread anterior
-                if self.thread_indexacion_activo and self.thread_indexacion_activo.is_alive():
-                    self.thread_indexacion_activo.join(timeout=2.0)
-                
-                self.indexando = False
+            # Una indexación anterior en curso queda cancelada: su hilo ve
+            # otra generación y termina solo, sin bloquear la interfaz
+            self.generacion_indexado += 1
+            self._cancelar_busqueda_contenido()
             
             # Limpiar estado anterior
-            with self.lock_indexacion:
-                self.todos_los_archivos = []
-                self.indice_nombres.clear()
-                self.indice_extensiones.clear()
-                self.resultados = []
-                self.cancelar_indexacion = False
+            self.indice = IndiceArchivos()
+            self.resultados = []
             
             self.unidad_seleccionada = unidad['ruta']
             self.indexando = True
             
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem(f"  Unidad seleccionada: {unidad['texto']}")
-            self.results_list.addItem(f"  Ruta: {unidad['ruta']}")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Indexando archivos...")
-            self.results_list.addItem("  Progreso: 0 archivos")
+            self._poblar_resultados([
+                "",
+                f"  Unidad seleccionada: {unidad['texto']}",
+                f"  Ruta: {unidad['ruta']}",
+                "",
+                "  Indexando archivos...",
+                "  Progreso: 0 archivos"
+            ])
             
             # Iniciar nuevo thread
-            self.thread_indexacion_activo = threading.Thread(
-                target=self.indexar_unidad_ultra_optimizado, 
+            threading.Thread(
+                target=self.indexar_unidad_ultra_optimizado,
+                args=(self.unidad_seleccionada, self.generacion_indexado),
                 daemon=True
-            )
-            self.thread_indexacion_activo.start()
+            ).start()
             
         except Exception as e:
             print(f"Error seleccionando unidad: {e}")
             self.indexando = False
     
-    def indexar_unidad_ultra_optimizado(self):
-        """Indexa archivos de forma ultra-optimizada con índices."""
-        archivos_temp = []
-        indices_nombres_temp = defaultdict(list)
-        indices_ext_temp = defaultdict(list)
+    def indexar_unidad_ultra_optimizado(self, raiz: str, generacion: int):
+        """
+        Indexa archivos de forma ultra-optimizada con índices.
+        
+        Los archivos se agregan a un IndiceArchivos local (columnas de
+        nombres, rutas y extensiones, sin un dict por archivo) que se
+        entrega al terminar, ya ordenado y con sus índices construidos,
+        con la señal indexacion_completa: el hilo de la interfaz es el
+        único que asigna self.indice.
+        
+        Args:
+            raiz: Ruta raíz de la unidad
+            generacion: Generación de indexado asignada a este hilo
+        """
+        indice = IndiceArchivos()
         
         try:
-            if not self.unidad_seleccionada:
-                return
-            
             contador = 0
             ultimo_update = 0
             
@@ -399,71 +442,74 @@ class BuscadorArchivos(VentanaBase):
                 'Windows.old', 'PerfLogs', 'hiberfil.sys', 'pagefile.sys'
             }
             
-            for root, dirs, files in os.walk(self.unidad_seleccionada):
+            # Recorrido iterativo con os.scandir: cada DirEntry trae el nombre, la ruta,
+            # el tipo y (en Windows) tamaño y fecha, sin un stat adicional por archivo
+            pendientes = [raiz]
+            while pendientes:
                 # Verificar cancelación
-                if self.cancelar_indexacion:
+                if generacion != self.generacion_indexado:
                     print("Indexacion cancelada")
                     return
                 
-                # Filtrar directorios del sistema (in-place)
-                dirs[:] = [d for d in dirs if d not in DIRS_IGNORAR and not d.startswith('$')]
-                
-                for nombre_archivo in files:
-                    # Verificar cancelación
-                    if self.cancelar_indexacion:
-                        print("Indexacion cancelada")
-                        return
-                    
-                    try:
-                        ruta_completa = os.path.join(root, nombre_archivo)
-                        extension = os.path.splitext(nombre_archivo)[1].lower()
-                        
-                        # Agregar archivo a lista temporal
-                        archivo_dict = {
-                            'nombre': nombre_archivo,
-                            'ruta': ruta_completa,
-                            'extension': extension
-                        }
-                        
-                        indice = len(archivos_temp)
-                        archivos_temp.append(archivo_dict)
-                        
-                        # Crear índices temporales
-                        nombre_sin_ext = os.path.splitext(nombre_archivo)[0].lower()
-                        indices_nombres_temp[nombre_sin_ext].append(indice)
-                        indices_ext_temp[extension].append(indice)
-                        
-                        contador += 1
-                        
-                        # Actualizar progreso cada UPDATE_INTERVAL archivos
-                        if contador - ultimo_update >= self.UPDATE_INTERVAL:
-                            self.signals.progreso_actualizado.emit(contador, 0, 0)
-                            ultimo_update = contador
-                    except Exception as e:
-                        continue
-            
-            # Solo actualizar si no fue cancelado
-            if not self.cancelar_indexacion:
-                with self.lock_indexacion:
-                    self.todos_los_archivos = archivos_temp
-                    self.indice_nombres = indices_nombres_temp
-                    self.indice_extensiones = indices_ext_temp
+                try:
+                    entradas = os.scandir(pendientes.pop())
+                except OSError:
+                    # Carpeta sin permisos o desaparecida: se omite como os.walk
+                    continue
                 
-                # Notificar finalización
-                self.signals.indexacion_completa.emit(len(self.todos_los_archivos))
+                with entradas:
+                    for entrada in entradas:
+                        try:
+                            if entrada.is_dir(follow_symlinks=False):
+                                # Omitir directorios del sistema
+                                nombre_dir = entrada.name
+                                if nombre_dir not in DIRS_IGNORAR and not nombre_dir.startswith('$'):
+                                    pendientes.append(entrada.path)
+                                continue
+                            
+                            if not entrada.is_file(follow_symlinks=False):
+                                continue
+                            
+                            nombre_archivo = entrada.name
+                            info = entrada.stat(follow_symlinks=False)
+                            indice.agregar(
+                                nombre_archivo,
+                                entrada.path,
+                                IndiceArchivos.extension_de(nombre_archivo),
+                                info.st_size,
+                                info.st_mtime_ns
+                            )
+                            
+                            contador += 1
+                            
+                            # Actualizar progreso cada UPDATE_INTERVAL archivos
+                            if contador - ultimo_update >= self.UPDATE_INTERVAL:
+                                self.signals.progreso_actualizado.emit(contador, 0, 0)
+                                ultimo_update = contador
+                        except OSError:
+                            continue
+            
+            indice.finalizar()
+            
+            # Notificar finalización; el slot descarta el índice si fue cancelado
+            self.signals.indexacion_completa.emit(generacion, indice)
             
         except Exception as e:
             print(f"Error indexando: {e}")
-            self.indexando = False
+            if generacion == self.generacion_indexado:
+                self.indexando = False
     
-    def _on_indexacion_completa(self, total):
+    def _on_indexacion_completa(self, generacion: int, indice: IndiceArchivos):
         """Callback cuando termina la indexación."""
         try:
+            if generacion != self.generacion_indexado:
+                return
+            
+            self.indice = indice
             self.indexando = False
-            self.cancelar_indexacion = False
             
-            print(f"Indexacion completa: {total:,} archivos")
-            print(f"Indices creados: {len(self.indice_nombres)} nombres, {len(self.indice_extensiones)} extensiones")
+            print(f"Indexacion completa: {len(indice):,} archivos")
+            print(f"Indices creados: {len(self.indice.trigramas)} trigramas, {len(self.indice.por_extension)} extensiones")
             
             self.mostrar_todos_los_archivos()
         except:
@@ -472,48 +518,58 @@ class BuscadorArchivos(VentanaBase):
     def _on_progreso_actualizado(self, actual, total, porcentaje):
         """Actualiza progreso de indexación."""
         try:
-            if self.indexando and self.results_list.count() >= 6:
-                item = self.results_list.item(5)
-                if item:
-                    item.setText(f"  Progreso: {actual:,} archivos")
+            if self.indexando:
+                self.modelo_resultados.cambiar_linea(5, f"  Progreso: {actual:,} archivos")
         except:
             pass
     
     def mostrar_todos_los_archivos(self):
         """Muestra todos los archivos de forma eficiente."""
         try:
-            self.results_list.clear()
-            self.resultados = self.todos_los_archivos
-            
-            try:
-                self.results_list.itemDoubleClicked.disconnect()
-            except:
-                pass
-            self.results_list.itemDoubleClicked.connect(self.abrir_item)
+            self.resultados = range(len(self.indice))
             
-            if not self.todos_los_archivos:
-                self.results_list.addItem("")
-                self.results_list.addItem("  No hay archivos")
+            if not self.resultados:
+                self._poblar_resultados(["", "  No hay archivos"])
                 return
             
-            total = len(self.todos_los_archivos)
-            self.results_list.addItem(f"  Total: {total:,} archivos indexados")
-            self.results_list.addItem(f"  Indices: {len(self.indice_nombres):,} nombres, {len(self.indice_extensiones):,} extensiones")
-            self.results_list.addItem("  " + "_" * 80)
+            total = len(self.resultados)
+            encabezado = [
+                f"  Total: {total:,} archivos indexados",
+                f"  Indices: {len(self.indice.trigramas):,} trigramas, {len(self.indice.por_extension):,} extensiones",
+                "  " + "_" * 80
+            ]
             
             # Mostrar solo los primeros archivos
-            limite = min(self.MAX_ARCHIVOS_MOSTRADOS, total)
-            for archivo in self.todos_los_archivos[:limite]:
-                self.results_list.addItem(f"  {archivo['nombre']}")
-            
+            pie = []
             if total > self.MAX_ARCHIVOS_MOSTRADOS:
                 restantes = total - self.MAX_ARCHIVOS_MOSTRADOS
-                self.results_list.addItem("")
-                self.results_list.addItem(f"  ... y {restantes:,} archivos mas (usa busqueda)")
+                pie = ["", f"  ... y {restantes:,} archivos mas (usa busqueda)"]
+            
+            self._poblar_resultados(
+                encabezado, self.resultados[:self.MAX_ARCHIVOS_MOSTRADOS], pie=pie
+            )
         
         except Exception as e:
             print(f"Error mostrando archivos: {e}")
     
+    def _poblar_resultados(self, encabezado: List[str], indices: Sequence[int] = (),
+                           prefijo: str = "  ", pie: List[str] = ()):
+        """
+        Reemplaza el contenido de la lista de resultados.
+        
+        Solo se reemplazan las referencias del modelo; los nombres se
+        leen de self.indice cuando la vista pinta cada fila.
+        
+        Args:
+            encabezado: Líneas de texto antes de los archivos
+            indices: Posiciones en self.indice de los archivos a mostrar
+            prefijo: Texto antepuesto al nombre de cada archivo
+            pie: Líneas de texto después de los archivos
+        """
+        self.modelo_resultados.establecer(
+            encabezado, self.indice.nombres, indices, prefijo, pie
+        )
+    
     # BÚSQUEDA ULTRA-RÁPIDA CON ÍNDICES
     def _ejecutar_busqueda_diferida(self):
         """Ejecuta búsqueda diferida."""
@@ -546,44 +602,18 @@ class BuscadorArchivos(VentanaBase):
         except Exception as e:
             print(f"Error en busqueda: {e}")
     
-    def _buscar_por_nombre_indexado(self, texto: str) -> List[Dict]:
-        """Búsqueda por nombre ultra-rápida usando índice."""
+    def _buscar_por_nombre_indexado(self, texto: str) -> List[int]:
+        """Búsqueda por nombre ultra-rápida usando el índice de trigramas."""
         try:
-            coincidencias = []
-            indices_encontrados = set()
-            
-            # Buscar en índice de nombres
-            for nombre_indexado, lista_indices in self.indice_nombres.items():
-                if texto in nombre_indexado:
-                    indices_encontrados.update(lista_indices)
-            
-            # Obtener archivos usando índices
-            for idx in sorted(indices_encontrados):
-                if idx < len(self.todos_los_archivos):
-                    coincidencias.append(self.todos_los_archivos[idx])
-                    if len(coincidencias) >= 50000:
-                        break
-            
-            return coincidencias
+            return self.indice.buscar_por_nombre(texto)
         except Exception as e:
             print(f"Error en busqueda indexada: {e}")
             return []
     
-    def _buscar_por_extension_indexado(self, texto: str) -> List[Dict]:
+    def _buscar_por_extension_indexado(self, texto: str) -> List[int]:
         """Búsqueda por extensión ultra-rápida usando índice."""
         try:
-            if not texto.startswith('.'):
-                texto = '.' + texto
-            
-            # Búsqueda directa en índice
-            indices = self.indice_extensiones.get(texto, [])
-            
-            coincidencias = []
-            for idx in indices:
-                if idx < len(self.todos_los_archivos):
-                    coincidencias.append(self.todos_los_archivos[idx])
-            
-            return coincidencias
+            return self.indice.buscar_por_extension(texto)
         except Exception as e:
             print(f"Error en busqueda extension: {e}")
             return []
@@ -601,7 +631,7 @@ class BuscadorArchivos(VentanaBase):
                 self.alerta("Selecciona una unidad USB primero")
                 return
             
-            if not self.todos_los_archivos:
+            if not len(self.indice):
                 self.alerta("No hay archivos indexados")
                 return
             
@@ -609,6 +639,7 @@ class BuscadorArchivos(VentanaBase):
                 return
             
             self.buscando_contenido = True
+            self.generacion_contenido += 1
             
             self.historial.agregar(texto)
             self.actualizar_completer()
@@ -616,17 +647,18 @@ class BuscadorArchivos(VentanaBase):
             self.btn_buscar.setEnabled(False)
             self.search_input.setEnabled(False)
             
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem("  BUSCANDO EN CONTENIDO...")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Por favor espera...")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Progreso: 0%")
+            self._poblar_resultados([
+                "",
+                "  BUSCANDO EN CONTENIDO...",
+                "",
+                "  Por favor espera...",
+                "",
+                "  Progreso: 0%"
+            ])
             
             threading.Thread(
                 target=self._ejecutar_busqueda_contenido_thread, 
-                args=(texto_busqueda,), 
+                args=(texto_busqueda, self.indice, self.generacion_contenido), 
                 daemon=True
             ).start()
             
@@ -634,31 +666,80 @@ class BuscadorArchivos(VentanaBase):
             print(f"Error iniciando busqueda por contenido: {e}")
             self.buscando_contenido = False
     
-    def _ejecutar_busqueda_contenido_thread(self, texto: str):
-        """Thread de búsqueda por contenido."""
+    def _ejecutar_busqueda_contenido_thread(self, texto: str, indice: IndiceArchivos,
+                                            generacion: int):
+        """
+        Thread de búsqueda por contenido.
+        
+        Reparte los archivos en un pool de hilos y recoge los resultados
+        a medida que terminan; con buscar_en_paralelo()
+        solo hay MAX_ARCHIVOS_EN_VUELO archivos enviados a la vez.
+        
+        Args:
+            texto: Texto a buscar
+            indice: Índice de la unidad al iniciar la búsqueda
+            generacion: Generación de búsqueda asignada a este hilo
+        """
         try:
             texto_lower = texto.lower()
             coincidencias = []
-            total = len(self.todos_los_archivos)
             
-            for idx, archivo in enumerate(self.todos_los_archivos):
-                try:
-                    if idx % 10 == 0:
-                        progreso = int((idx / total) * 100)
-                        self.signals.progreso_actualizado.emit(idx, total, progreso)
+            # Solo se leen las extensiones que algún lector sabe extraer;
+            # fotos, videos y ejecutables se descartan sin abrirlos. El tamaño
+            # guardado al indexar descarta los archivos grandes sin un stat
+            tamanios = indice.tamanios
+            candidatos = [
+                idx
+                for extension, posiciones in indice.por_extension.items()
+                if LectorFactory.tiene_lector(extension)
+                for idx in posiciones
+                if tamanios[idx] <= MAX_TAMANIO_CONTENIDO
+            ]
+            # Los archivos chicos primero: aparecen coincidencias y avanza el
+            # progreso antes de llegar a los grandes
+            candidatos.sort(key=tamanios.__getitem__)
+            total = len(candidatos)
+            
+            # La lectura y los extractores liberan el GIL: mientras un hilo
+            # espera al disco, otro analiza el archivo que ya leyó
+            with ThreadPoolExecutor(max_workers=MAX_HILOS_CONTENIDO) as pool:
+                hechos = 0
+                ultimo_aviso = 0
+                
+                for terminados, encontrados in buscar_en_paralelo(
+                    pool, indice, candidatos, texto_lower
+                ):
+                    if generacion != self.generacion_contenido:
+                        return
                     
-                    contenido = leer_contenido_archivo(archivo['ruta'])
+                    coincidencias.extend(encontrados)
                     
-                    if texto_lower in contenido:
-                        coincidencias.append(archivo)
-                except:
-                    continue
-            
-            self.signals.busqueda_finalizada.emit(coincidencias, texto)
+                    hechos += terminados
+                    if hechos - ultimo_aviso >= 10:
+                        ultimo_aviso = hechos
+                        progreso = int((hechos / total) * 100)
+                        self.signals.progreso_actualizado.emit(hechos, total, progreso)
+            
+            # Los archivos terminan en cualquier orden; las posiciones
+            # del índice ordenadas restauran el orden alfabético
+            coincidencias.sort()
+            if generacion == self.generacion_contenido:
+                self.signals.busqueda_finalizada.emit(indice, coincidencias, texto)
         except Exception as e:
-            self.signals.error_busqueda.emit(str(e))
+            if generacion == self.generacion_contenido:
+                self.signals.error_busqueda.emit(str(e))
+    
+    def _cancelar_busqueda_contenido(self):
+        """Abandona la búsqueda por contenido en curso y reactiva los controles."""
+        self.generacion_contenido += 1
+        
+        if self.buscando_contenido:
+            self.buscando_contenido = False
+            self.btn_buscar.setEnabled(True)
+            self.search_input.setEnabled(True)
     
-    def _on_busqueda_finalizada(self, coincidencias: List[Dict], texto: str):
+    def _on_busqueda_finalizada(self, indice: IndiceArchivos,
+                                coincidencias: List[int], texto: str):
         """Finaliza búsqueda."""
         try:
             self.buscando_contenido = False
@@ -666,6 +747,10 @@ class BuscadorArchivos(VentanaBase):
             self.btn_buscar.setEnabled(True)
             self.search_input.setEnabled(True)
             
+            # Las posiciones solo valen para el índice sobre el que se buscó
+            if indice is not self.indice:
+                return
+            
             self._mostrar_resultados_contenido(coincidencias, texto)
         except:
             pass
@@ -678,84 +763,73 @@ class BuscadorArchivos(VentanaBase):
             self.btn_buscar.setEnabled(True)
             self.search_input.setEnabled(True)
             
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem(f"  Error: {error}")
+            self._poblar_resultados(["", f"  Error: {error}"])
         except:
             pass
     
-    def _mostrar_resultados(self, coincidencias: List[Dict], texto: str):
+    def _mostrar_resultados(self, coincidencias: Sequence[int], texto: str):
         """Muestra resultados."""
         try:
-            self.results_list.clear()
             self.resultados = coincidencias
             
-            try:
-                self.results_list.itemDoubleClicked.disconnect()
-            except:
-                pass
-            self.results_list.itemDoubleClicked.connect(self.abrir_item)
-            
             tipo_str = "extension" if self.tipo_busqueda == self.BUSQUEDA_EXTENSION else "nombre"
             
-            self.results_list.addItem("")
-            self.results_list.addItem(f"  Busqueda por {tipo_str}: '{texto}'")
-            self.results_list.addItem(f"  Resultados: {len(coincidencias):,} archivo(s)")
-            self.results_list.addItem("")
-            self.results_list.addItem("  " + "=" * 80)
+            encabezado = [
+                "",
+                f"  Busqueda por {tipo_str}: '{texto}'",
+                f"  Resultados: {len(coincidencias):,} archivo(s)",
+                "",
+                "  " + "=" * 80
+            ]
             
             if not coincidencias:
-                self.results_list.addItem("")
-                self.results_list.addItem("  No se encontraron archivos")
+                self._poblar_resultados(encabezado + ["", "  No se encontraron archivos"])
                 return
             
-            limite = min(self.MAX_ARCHIVOS_MOSTRADOS, len(coincidencias))
-            for archivo in coincidencias[:limite]:
-                self.results_list.addItem(f"  {archivo['nombre']}")
-            
+            pie = []
             if len(coincidencias) > self.MAX_ARCHIVOS_MOSTRADOS:
                 restantes = len(coincidencias) - self.MAX_ARCHIVOS_MOSTRADOS
-                self.results_list.addItem("")
-                self.results_list.addItem(f"  ... y {restantes:,} mas")
+                pie = ["", f"  ... y {restantes:,} mas"]
+            
+            self._poblar_resultados(
+                encabezado, coincidencias[:self.MAX_ARCHIVOS_MOSTRADOS], pie=pie
+            )
         except Exception as e:
             print(f"Error mostrando resultados: {e}")
     
-    def _mostrar_resultados_contenido(self, coincidencias: List[Dict], texto: str):
+    def _mostrar_resultados_contenido(self, coincidencias: Sequence[int], texto: str):
         """Muestra resultados de contenido."""
         try:
-            self.results_list.clear()
             self.resultados = coincidencias
             
-            try:
-                self.results_list.itemDoubleClicked.disconnect()
-            except:
-                pass
-            self.results_list.itemDoubleClicked.connect(self.abrir_item)
-            
-            self.results_list.addItem("")
-            self.results_list.addItem(f"  Busqueda por CONTENIDO: '{texto}'")
-            self.results_list.addItem(f"  Resultados: {len(coincidencias):,} archivo(s)")
-            self.results_list.addItem("")
-            self.results_list.addItem("  " + "=" * 80)
+            encabezado = [
+                "",
+                f"  Busqueda por CONTENIDO: '{texto}'",
+                f"  Resultados: {len(coincidencias):,} archivo(s)",
+                "",
+                "  " + "=" * 80
+            ]
             
             if not coincidencias:
-                self.results_list.addItem("")
-                self.results_list.addItem("  No se encontraron archivos")
-                self.results_list.addItem("")
-                self.results_list.addItem("  Consejos:")
-                self.results_list.addItem("     - Verifica la ortografia")
-                self.results_list.addItem("     - Intenta palabras mas simples")
+                self._poblar_resultados(encabezado + [
+                    "",
+                    "  No se encontraron archivos",
+                    "",
+                    "  Consejos:",
+                    "     - Verifica la ortografia",
+                    "     - Intenta palabras mas simples"
+                ])
                 return
             
-            self.results_list.addItem("")
-            limite = min(self.MAX_ARCHIVOS_MOSTRADOS, len(coincidencias))
-            for archivo in coincidencias[:limite]:
-                self.results_list.addItem(f"   {archivo['nombre']}")
-            
+            pie = []
             if len(coincidencias) > self.MAX_ARCHIVOS_MOSTRADOS:
                 restantes = len(coincidencias) - self.MAX_ARCHIVOS_MOSTRADOS
-                self.results_list.addItem("")
-                self.results_list.addItem(f"  ... y {restantes:,} mas")
+                pie = ["", f"  ... y {restantes:,} mas"]
+            
+            self._poblar_resultados(
+                encabezado + [""], coincidencias[:self.MAX_ARCHIVOS_MOSTRADOS],
+                prefijo="   ", pie=pie
+            )
         except Exception as e:
             print(f"Error mostrando resultados contenido: {e}")
     
@@ -779,20 +853,22 @@ class BuscadorArchivos(VentanaBase):
         except Exception as e:
             print(f"Error buscando: {e}")
     
-    def abrir_item(self, item):
+    def abrir_item(self, item: QModelIndex):
         """Abre archivo."""
         try:
-            texto = item.text().strip()
-            
-            for archivo in self.resultados:
-                if archivo['nombre'] == texto:
-                    if platform.system() == 'Windows':
-                        os.startfile(archivo['ruta'])
-                    elif platform.system() == 'Darwin':
-                        subprocess.call(['open', archivo['ruta']])
-                    else:
-                        subprocess.call(['xdg-open', archivo['ruta']])
-                    return
+            # Las filas de archivo guardan su posición en self.indice;
+            # los encabezados y mensajes no tienen datos asociados
+            indice = item.data(Qt.UserRole)
+            if indice is None:
+                return
+            
+            ruta = self.indice.rutas[indice]
+            if SISTEMA == 'Windows':
+                os.startfile(ruta)
+            elif SISTEMA == 'Darwin':
+                subprocess.call(['open', ruta])
+            else:
+                subprocess.call(['xdg-open', ruta])
         except Exception as e:
             print(f"Error abriendo: {e}")
     
@@ -807,12 +883,13 @@ class BuscadorArchivos(VentanaBase):
     def mostrar_mensaje_inicial(self):
         """Mensaje inicial."""
         try:
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem("  Buscador de Archivos USB")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Selecciona una unidad USB...")
-            self.results_list.addItem("")
+            self._poblar_resultados([
+                "",
+                "  Buscador de Archivos USB",
+                "",
+                "  Selecciona una unidad USB...",
+                ""
+            ])
         except:
             pass
     
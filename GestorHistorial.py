@@ -1,6 +1,6 @@
 import json
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class GestorHistorial:
@@ -26,6 +26,10 @@ class GestorHistorial:
         """
         self.archivo = archivo
         self.historial: List[str] = self._cargar_historial()
+        
+        # Copia ordenada e inmutable para obtener_todos(); se descarta
+        # cada vez que el historial cambia
+        self._cache_todos: Optional[Tuple[str, ...]] = None
     
     def _cargar_historial(self) -> List[str]:
         """
@@ -54,6 +58,9 @@ class GestorHistorial:
         Returns:
             True si se guardó exitosamente, False en caso contrario
         """
+        # Toda modificación pasa por aquí: invalidar la copia cacheada
+        self._cache_todos = None
+        
         try:
             # Ordenar antes de guardar para mantener consistencia
             self.historial = self._ordenar_lista(self.historial)
@@ -151,14 +158,19 @@ class GestorHistorial:
         self.historial = []
         return self._guardar_historial()
     
-    def obtener_todos(self) -> List[str]:
+    def obtener_todos(self) -> Tuple[str, ...]:
         """
         Obtiene todo el historial ordenado alfabéticamente.
         
+        El resultado se cachea hasta la próxima modificación, así que
+        llamarlo repetidamente no vuelve a ordenar ni a copiar.
+        
         Returns:
-            Lista completa del historial ordenado
+            Tupla con el historial completo ordenado
         """
-        return self._ordenar_lista(self.historial)
+        if self._cache_todos is None:
+            self._cache_todos = tuple(self._ordenar_lista(self.historial))
+        return self._cache_todos
     
     def total_busquedas(self) -> int:
         """
@@ -0,0 +1,266 @@
+import os
+import pickle
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class IndiceArchivos:
+    """
+    Índice en memoria de los archivos de una unidad.
+    - Columnas paralelas (nombres, rutas, extensiones, tamaños, fechas) en lugar
+      de un dict por archivo
+    - Nombre sin extensión en minúsculas precalculado para las búsquedas
+    - Orden alfabético (case-insensitive)
+    - Índice invertido por trigramas del nombre sin extensión
+    - Índice invertido por extensión
+    - Se puede guardar en disco y volver a cargar
+
+    Los archivos se identifican por su posición (int) en las columnas.
+    """
+
+    # Longitud de los fragmentos del índice invertido de nombres
+    TAMANIO_TRIGRAMA = 3
+
+    # Ningún nombre de archivo puede contener este carácter
+    SEPARADOR = '\0'
+
+    # Formato del archivo guardado; cambiarlo invalida los archivos anteriores
+    VERSION_ARCHIVO = 3
+
+    def __init__(self):
+        """Crea un índice vacío."""
+        self.nombres: List[str] = []
+        self.rutas: List[str] = []
+        self.extensiones: List[str] = []
+        self.tamanios: List[int] = []
+        self.fechas: List[int] = []
+        self.bases: List[str] = []
+        self.texto_bases = ''
+        self.inicios_bases: List[int] = []
+        self.trigramas: Dict[str, Set[int]] = {}
+        self.por_extension: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    @staticmethod
+    def extension_de(nombre: str) -> str:
+        """
+        Extensión en minúsculas de un nombre de archivo (ej: '.pdf').
+
+        Igual que os.path.splitext, un punto inicial (ej: '.gitignore') no
+        marca extensión. Las extensiones se internan: hay pocas distintas y
+        todos los archivos del mismo tipo comparten el mismo str.
+
+        Args:
+            nombre: Nombre del archivo, sin carpetas
+        """
+        punto = nombre.rfind('.')
+        if punto <= 0:
+            return ''
+        return sys.intern(nombre[punto:].lower())
+
+    def agregar(self, nombre: str, ruta: str, extension: str, tamanio: int, fecha: int):
+        """
+        Agrega un archivo al final de las columnas.
+
+        Args:
+            nombre: Nombre del archivo con extensión
+            ruta: Ruta completa del archivo
+            extension: Extensión en minúsculas (ej: '.pdf')
+            tamanio: Tamaño en bytes al indexar
+            fecha: Fecha de modificación (st_mtime_ns) al indexar
+        """
+        self.nombres.append(nombre)
+        self.rutas.append(ruta)
+        self.extensiones.append(extension)
+        self.tamanios.append(tamanio)
+        self.fechas.append(fecha)
+        self.bases.append(nombre[:len(nombre) - len(extension)].lower())
+
+    def unir(self, otro: 'IndiceArchivos'):
+        """
+        Agrega al final las columnas de otro índice sin finalizar.
+
+        Args:
+            otro: Índice armado por separado (ej: el de una subcarpeta)
+        """
+        self.nombres.extend(otro.nombres)
+        self.rutas.extend(otro.rutas)
+        self.extensiones.extend(otro.extensiones)
+        self.tamanios.extend(otro.tamanios)
+        self.fechas.extend(otro.fechas)
+        self.bases.extend(otro.bases)
+
+    def finalizar(self):
+        """
+        Ordena las columnas alfabéticamente y construye los índices invertidos.
+        Se llama una vez, cuando terminó el recorrido de la unidad.
+        """
+        # Cada nombre se pasa a minúsculas una sola vez, no en cada comparación
+        claves = [nombre.lower() for nombre in self.nombres]
+        orden = sorted(range(len(claves)), key=claves.__getitem__)
+
+        self.nombres = [self.nombres[i] for i in orden]
+        self.rutas = [self.rutas[i] for i in orden]
+        self.extensiones = [self.extensiones[i] for i in orden]
+        self.tamanios = [self.tamanios[i] for i in orden]
+        self.fechas = [self.fechas[i] for i in orden]
+        self.bases = [self.bases[i] for i in orden]
+
+        self._construir_indices()
+
+    def firma(self, i: int) -> Tuple[int, int]:
+        """
+        Fecha de modificación y tamaño de un archivo, tal como se indexó.
+
+        Identifica la versión del archivo sin un os.stat (ver
+        lectores.contiene_texto); volver a indexar la actualiza.
+
+        Args:
+            i: Posición del archivo en las columnas
+        """
+        return self.fechas[i], self.tamanios[i]
+
+    def _construir_indices(self):
+        """Construye los índices de trigramas y de extensiones."""
+        trigramas = defaultdict(set)
+        por_extension = defaultdict(list)
+        n = self.TAMANIO_TRIGRAMA
+
+        for i, (base, extension) in enumerate(zip(self.bases, self.extensiones)):
+            for j in range(len(base) - n + 1):
+                trigramas[base[j:j + n]].add(i)
+            por_extension[extension].append(i)
+
+        self.trigramas = dict(trigramas)
+        self.por_extension = dict(por_extension)
+
+        # Todos los nombres en un solo texto, para recorrerlos con str.find
+        inicios = []
+        posicion = 0
+        for base in self.bases:
+            inicios.append(posicion)
+            posicion += len(base) + 1
+        self.inicios_bases = inicios
+        self.texto_bases = self.SEPARADOR.join(self.bases)
+
+    def _buscar_en_texto_bases(self, texto: str) -> List[int]:
+        """
+        Busca el texto recorriendo todos los nombres de una sola pasada.
+
+        str.find avanza sobre el texto unido en C; cada coincidencia se
+        traduce a su archivo con una búsqueda binaria sobre los inicios.
+
+        Args:
+            texto: Texto a buscar, en minúsculas y no vacío
+
+        Returns:
+            Posiciones de los archivos encontrados, en orden alfabético
+        """
+        coincidencias = []
+        inicios = self.inicios_bases
+        total = len(inicios)
+        posicion = self.texto_bases.find(texto)
+
+        while posicion >= 0:
+            i = bisect_right(inicios, posicion) - 1
+            coincidencias.append(i)
+            if i + 1 >= total:
+                break
+            # Saltar al siguiente nombre
+            posicion = self.texto_bases.find(texto, inicios[i + 1])
+
+        return coincidencias
+
+    def buscar_por_nombre(self, texto: str) -> List[int]:
+        """
+        Busca archivos cuyo nombre (sin extensión) contenga el texto.
+
+        Los candidatos son los archivos que contienen todos los trigramas
+        del texto; luego se confirma la coincidencia exacta de la subcadena.
+        Textos más cortos que un trigrama recorren todos los nombres con
+        una sola búsqueda sobre el texto unido.
+
+        Args:
+            texto: Texto a buscar, en minúsculas
+
+        Returns:
+            Posiciones de los archivos encontrados, en orden alfabético
+        """
+        n = self.TAMANIO_TRIGRAMA
+        bases = self.bases
+
+        if not texto:
+            return list(range(len(bases)))
+        if len(texto) < n:
+            return self._buscar_en_texto_bases(texto)
+
+        fragmentos = {texto[j:j + n] for j in range(len(texto) - n + 1)}
+
+        # Intersectar empezando por las listas más cortas
+        listas = sorted((self.trigramas.get(f, set()) for f in fragmentos), key=len)
+        candidatos = set(listas[0])
+        for lista in listas[1:]:
+            if not candidatos:
+                break
+            candidatos &= lista
+
+        return [i for i in sorted(candidatos) if texto in bases[i]]
+
+    def guardar(self, ruta_archivo: str):
+        """
+        Guarda las columnas ordenadas en disco.
+
+        Los índices invertidos no se guardan: se reconstruyen al cargar.
+        Se escribe en un archivo temporal y luego se reemplaza, así una
+        escritura interrumpida no deja un archivo a medias.
+
+        Args:
+            ruta_archivo: Archivo de destino
+        """
+        datos = (self.VERSION_ARCHIVO, self.nombres, self.rutas,
+                 self.extensiones, self.tamanios, self.fechas, self.bases)
+        temporal = ruta_archivo + '.tmp'
+        with open(temporal, 'wb') as f:
+            pickle.dump(datos, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta_archivo)
+
+    @classmethod
+    def cargar(cls, ruta_archivo: str) -> Optional['IndiceArchivos']:
+        """
+        Carga un índice guardado con guardar().
+
+        Args:
+            ruta_archivo: Archivo guardado previamente
+
+        Returns:
+            El índice listo para buscar, o None si el archivo es de otra versión
+        """
+        with open(ruta_archivo, 'rb') as f:
+            datos = pickle.load(f)
+
+        if datos[0] != cls.VERSION_ARCHIVO:
+            return None
+
+        indice = cls()
+        (_, indice.nombres, indice.rutas, indice.extensiones,
+         indice.tamanios, indice.fechas, indice.bases) = datos
+        indice._construir_indices()
+        return indice
+
+    def buscar_por_extension(self, extension: str) -> List[int]:
+        """
+        Busca archivos por extensión exacta.
+
+        Args:
+            extension: Extensión en minúsculas, con o sin punto inicial
+
+        Returns:
+            Posiciones de los archivos con esa extensión
+        """
+        if not extension.startswith('.'):
+            extension = '.' + extension
+        return self.por_extension.get(extension, [])
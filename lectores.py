@@ -1,6 +1,87 @@
 import os
+import mmap
+import pickle
+import codecs
+import importlib
+import threading
+import zipfile
+from xml.etree import ElementTree
+import re
+from collections import OrderedDict
+from concurrent.futures import Executor, wait, FIRST_COMPLETED
+from itertools import islice
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# MÓDULOS OPCIONALES
+
+# Módulo ya importado (o None si no está instalado), por nombre
+_modulos_opcionales: Dict[str, object] = {}
+
+
+def _importar(nombre: str):
+    """
+    Importa un módulo opcional la primera vez que se necesita.
+    
+    El resultado queda memorizado, incluso si el módulo no está instalado:
+    la búsqueda por contenido no repite el import (ni el ImportError)
+    por cada archivo.
+    
+    Args:
+        nombre: Nombre del módulo (ej: 'pypdfium2')
+        
+    Returns:
+        El módulo, o None si no está instalado
+    """
+    try:
+        return _modulos_opcionales[nombre]
+    except KeyError:
+        pass
+    
+    try:
+        modulo = importlib.import_module(nombre)
+    except ImportError:
+        modulo = None
+    
+    _modulos_opcionales[nombre] = modulo
+    return modulo
+
+
+def _requerir(nombre: str):
+    """Igual que _importar(), pero lanza ImportError si el módulo no está."""
+    modulo = _importar(nombre)
+    if modulo is None:
+        raise ImportError(f"El módulo '{nombre}' no está instalado")
+    return modulo
+
+
+# PDFium no admite llamadas simultáneas, ni siquiera sobre documentos
+# distintos: toda llamada a pypdfium2 se hace con este candado tomado
+_candado_pdfium = threading.Lock()
+
+
+# DOCUMENTOS OFFICE (ZIP + XML)
+
+def _parrafos_xml(archivo, etiqueta_parrafo: str, etiqueta_texto: str) -> Iterator[str]:
+    """
+    Recorre los párrafos de un XML de Office, en minúsculas.
+    
+    El XML se analiza con el parser en C de ElementTree a medida que se lee
+    del ZIP, sin construir el modelo de objetos de python-docx o
+    python-pptx. Los fragmentos de texto de cada párrafo se unen, así una
+    palabra dividida en varios formatos sigue apareciendo entera.
+    
+    Args:
+        archivo: XML abierto en modo binario (ej: con ZipFile.open)
+        etiqueta_parrafo: Etiqueta de párrafo, con espacio de nombres
+        etiqueta_texto: Etiqueta de fragmento de texto, con espacio de nombres
+    """
+    for _, elemento in ElementTree.iterparse(archivo):
+        if elemento.tag == etiqueta_parrafo:
+            yield ''.join(t.text or '' for t in elemento.iter(etiqueta_texto)).lower()
+            # Los párrafos ya leídos no se conservan en memoria
+            elemento.clear()
 
 
 # CLASE BASE INTERFAZ
@@ -12,8 +93,14 @@ class LectorArchivo(ABC):
     Define el contrato que deben cumplir todos los lectores:
     - Método leer(): lee el contenido del archivo
     - Método puede_leer(): verifica si puede leer una extensión
+    - Método contiene(): verifica si el archivo contiene un texto
+      (opcional; por defecto usa leer())
     """
     
+    # Si es True, contiene_texto() busca sobre el contenido memorizado:
+    # extraer el texto cuesta más que conservarlo entre búsquedas
+    USAR_CACHE = True
+    
     @abstractmethod
     def leer(self, ruta: str) -> str:
         """
@@ -39,6 +126,41 @@ class LectorArchivo(ABC):
             True si puede leer, False en caso contrario
         """
         pass
+    
+    def contiene(self, ruta: str, texto: str) -> bool:
+        """
+        Verifica si el archivo contiene el texto.
+        
+        contiene_texto() solo lo usa con los lectores con USAR_CACHE = False,
+        que pueden sobrescribirlo para cortar la lectura en cuanto aparece
+        la primera coincidencia; los demás se buscan sobre el contenido
+        memorizado.
+        
+        Args:
+            ruta: Ruta completa del archivo
+            texto: Texto a buscar, en minúsculas
+            
+        Returns:
+            True si el contenido incluye el texto
+        """
+        return texto in leer_contenido_archivo(ruta)
+    
+    def extraer(self, ruta: str) -> str:
+        """
+        Igual que leer(), pero lanza la excepción si no se pudo extraer.
+        
+        El caché de contenido usa este método: un error pasajero (una
+        lectura fallida en el USB, un archivo bloqueado, un módulo que no
+        está instalado) no queda memorizado como contenido vacío. Por
+        defecto usa leer(), para los lectores que solo implementan ese método.
+        
+        Args:
+            ruta: Ruta completa del archivo
+            
+        Returns:
+            Contenido del archivo en minúsculas
+        """
+        return self.leer(ruta)
 
 
 # LECTORES CONCRETOS (uno por cada formato)
@@ -46,7 +168,8 @@ class LectorArchivo(ABC):
 class LectorTexto(LectorArchivo):
     """
     Lector para archivos de texto plano.
-    Soporta múltiples encodings para manejar diferentes idiomas.
+    Soporta múltiples encodings para manejar diferentes idiomas:
+    BOM (UTF-8/UTF-16), luego UTF-8 y por último Windows-1252.
     """
     
     EXTENSIONES = {
@@ -54,59 +177,260 @@ class LectorTexto(LectorArchivo):
         '.py', '.js', '.css', '.md', '.ini', '.conf'
     }
     
-    ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+    # Marcas de orden de bytes reconocidas al inicio del archivo
+    BOMS = [
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    ]
+    
+    # Si no es UTF-8 válido; los bytes sin carácter se reemplazan
+    ENCODING_RESPALDO = 'cp1252'
+    
+    # Bytes que se pasan a minúsculas de una vez al recorrer el archivo
+    TAMANIO_BLOQUE = 1024 * 1024
+    
+    # Por debajo de este tamaño, una sola lectura cuesta menos que mapear el archivo
+    UMBRAL_MMAP = 256 * 1024
+    
+    # Recorrer los bytes con mmap es más rápido que conservar el texto
+    USAR_CACHE = False
     
     def puede_leer(self, extension: str) -> bool:
         return extension.lower() in self.EXTENSIONES
     
+    @staticmethod
+    def _parte_ascii(texto: str) -> bytes:
+        """Tramo ASCII más largo del texto, como bytes (b'' si no tiene)."""
+        tramos = ''.join(c if c.isascii() else '\0' for c in texto).split('\0')
+        return max(tramos, key=len).encode('ascii')
+    
+    def contiene(self, ruta: str, texto: str) -> bool:
+        """
+        Busca el texto directamente en los bytes del archivo.
+        
+        Los archivos chicos se leen de una vez; los grandes se recorren con
+        mmap, sin copiar el archivo entero a la memoria del proceso.
+        Para textos ASCII no hace falta decodificar: los encodings
+        soportados representan ASCII igual, así que basta con pasar cada
+        bloque a minúsculas y buscar con bytes.find. Se detiene en la
+        primera coincidencia. Textos con otros caracteres (ej: 'canción')
+        buscan primero su tramo ASCII más largo ('canci'): si no aparece,
+        el archivo se descarta sin decodificarlo; si aparece, se confirma
+        decodificando por bloques. Los archivos UTF-16 siempre se decodifican.
+        
+        Un error de lectura (OSError) no se convierte en False: sigue hacia
+        quien llama, así el resultado no queda memorizado.
+        """
+        es_ascii = texto.isascii()
+        aguja = texto.encode('ascii') if es_ascii else self._parte_ascii(texto)
+        
+        # Sin caracteres ASCII (ej: texto en cirílico) no hay nada que filtrar
+        if not es_ascii and not aguja:
+            return self._contiene_decodificando(ruta, texto)
+        
+        try:
+            with open(ruta, 'rb') as f:
+                tamanio = os.fstat(f.fileno()).st_size
+                if tamanio == 0:
+                    return not texto
+                
+                if tamanio < self.UMBRAL_MMAP:
+                    datos = f.read()
+                    if datos[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+                        return self._contiene_decodificando(ruta, texto)
+                    encontrado = datos.lower().find(aguja) >= 0
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if mm[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+                            return self._contiene_decodificando(ruta, texto)
+                        
+                        # Lectura secuencial (solo donde el sistema lo soporta)
+                        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        
+                        encontrado = False
+                        # Los bloques se solapan para no perder coincidencias en el borde
+                        avance = max(self.TAMANIO_BLOQUE - len(aguja) + 1, 1)
+                        for inicio in range(0, len(mm), avance):
+                            bloque = mm[inicio:inicio + self.TAMANIO_BLOQUE].lower()
+                            if bloque.find(aguja) >= 0:
+                                encontrado = True
+                                break
+        except ValueError:
+            # El archivo quedó vacío entre fstat y mmap
+            return False
+        
+        if not encontrado or es_ascii:
+            return encontrado
+        
+        # El tramo ASCII aparece: confirmar el texto completo
+        return self._contiene_decodificando(ruta, texto)
+    
+    def _contiene_decodificando(self, ruta: str, texto: str) -> bool:
+        """
+        Busca el texto decodificando el archivo por bloques.
+        
+        Usa los mismos encodings que leer(), pero con un decodificador
+        incremental: la memoria queda limitada a un bloque y la lectura
+        termina en la primera coincidencia. Entre bloques se conservan los
+        últimos len(texto) - 1 caracteres para no perder coincidencias
+        en el borde.
+        """
+        with open(ruta, 'rb') as f:
+            inicio = f.read(len(codecs.BOM_UTF8))
+            
+            encodings = ['utf-8', self.ENCODING_RESPALDO]
+            for bom, encoding in self.BOMS:
+                if inicio.startswith(bom):
+                    encodings = [encoding]
+                    break
+            
+            for encoding in encodings:
+                # UTF-8 estricto solo mientras quede el respaldo
+                errores = 'strict' if encoding == 'utf-8' and len(encodings) > 1 else 'replace'
+                decodificador = codecs.getincrementaldecoder(encoding)(errors=errores)
+                cola = ''
+                f.seek(0)
+                
+                try:
+                    while True:
+                        bloque = f.read(self.TAMANIO_BLOQUE)
+                        fin = not bloque
+                        trozo = cola + decodificador.decode(bloque, final=fin).lower()
+                        
+                        if texto in trozo:
+                            return True
+                        if fin:
+                            return False
+                        
+                        cola = trozo[max(len(trozo) - len(texto) + 1, 0):]
+                except UnicodeDecodeError:
+                    continue
+        return False
+    
     def leer(self, ruta: str) -> str:
-        """Lee archivo de texto probando múltiples encodings."""
-        for encoding in self.ENCODINGS:
-            try:
-                with open(ruta, 'r', encoding=encoding) as f:
-                    return f.read().lower()
-            except (UnicodeDecodeError, IOError):
-                continue
-        return ""
+        """Lee archivo de texto; string vacío si no se pudo leer."""
+        try:
+            return self.extraer(ruta)
+        except OSError:
+            return ""
+    
+    def extraer(self, ruta: str) -> str:
+        """
+        Lee archivo de texto con una sola lectura del disco.
+        
+        Los bytes se leen una vez y se decodifican en memoria: primero
+        según el BOM, si hay; si no, como UTF-8 y, si falla, Windows-1252.
+        """
+        with open(ruta, 'rb') as f:
+            datos = f.read()
+        
+        for bom, encoding in self.BOMS:
+            if datos.startswith(bom):
+                return datos.decode(encoding, errors='replace').lower()
+        
+        try:
+            return datos.decode('utf-8').lower()
+        except UnicodeDecodeError:
+            return datos.decode(self.ENCODING_RESPALDO, errors='replace').lower()
 
 
 class LectorPDF(LectorArchivo):
-    """Lector para archivos PDF usando PyPDF2."""
+    """
+    Lector para archivos PDF.
+    Usa pypdfium2 (PDFium, en C++) si está instalado; si no, PyPDF2.
+    Las llamadas a PDFium se serializan con _candado_pdfium, porque la
+    búsqueda por contenido lee varios archivos a la vez desde un pool de hilos.
+    """
     
     def puede_leer(self, extension: str) -> bool:
         return extension.lower() == '.pdf'
     
+    def _paginas(self, ruta: str) -> Iterator[str]:
+        """
+        Extrae el texto de cada página, en minúsculas, a medida que se pide.
+        
+        El candado se toma por llamada (abrir, cada página, cerrar) y no
+        mientras se entrega una página: otro hilo puede avanzar con su PDF
+        mientras este une el texto de la página.
+        """
+        pdfium = _importar('pypdfium2')
+        try:
+            with _candado_pdfium:
+                pdf = pdfium.PdfDocument(ruta)
+                total = len(pdf)
+        except Exception:
+            # Sin pypdfium2, o PDFium no pudo abrir el archivo
+            yield from self._paginas_pypdf2(ruta)
+            return
+        
+        try:
+            for i in range(total):
+                with _candado_pdfium:
+                    pagina = pdf[i]
+                    try:
+                        textpage = pagina.get_textpage()
+                        try:
+                            texto = textpage.get_text_range()
+                        finally:
+                            textpage.close()
+                    finally:
+                        pagina.close()
+                yield texto.lower()
+        finally:
+            with _candado_pdfium:
+                pdf.close()
+    
+    def _paginas_pypdf2(self, ruta: str) -> Iterator[str]:
+        """Igual que _paginas, pero con PyPDF2 (Python puro, más lento)."""
+        PyPDF2 = _requerir('PyPDF2')
+        with open(ruta, 'rb') as f:
+            pdf = PyPDF2.PdfReader(f)
+            for page in pdf.pages:
+                yield (page.extract_text() or '').lower()
+    
     def leer(self, ruta: str) -> str:
         """Extrae texto de todas las páginas del PDF."""
         try:
-            import PyPDF2
-            with open(ruta, 'rb') as f:
-                pdf = PyPDF2.PdfReader(f)
-                texto = ''
-                for page in pdf.pages:
-                    texto += page.extract_text()
-                return texto.lower()
+            return self.extraer(ruta)
         except Exception as e:
             print(f"Error leyendo PDF {ruta}: {e}")
             return ""
+    
+    def extraer(self, ruta: str) -> str:
+        """Como leer(), pero lanza la excepción si falla."""
+        return ''.join(self._paginas(ruta))
 
 
 class LectorDOCX(LectorArchivo):
-    """Lector para archivos Word (.docx)."""
+    """
+    Lector para archivos Word (.docx).
+    Lee word/document.xml directamente del ZIP, sin python-docx.
+    """
+    
+    # Espacio de nombres de WordprocessingML
+    _W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
     
     def puede_leer(self, extension: str) -> bool:
         return extension.lower() == '.docx'
     
+    def _parrafos(self, ruta: str) -> Iterator[str]:
+        """Recorre los párrafos del documento (incluidas tablas), en minúsculas."""
+        with zipfile.ZipFile(ruta) as z, z.open('word/document.xml') as xml:
+            yield from _parrafos_xml(xml, self._W + 'p', self._W + 't')
+    
     def leer(self, ruta: str) -> str:
         """Extrae texto de todos los párrafos del documento."""
         try:
-            import docx
-            doc = docx.Document(ruta)
-            texto = '\n'.join([p.text for p in doc.paragraphs])
-            return texto.lower()
+            return self.extraer(ruta)
         except Exception as e:
             print(f"Error leyendo DOCX {ruta}: {e}")
             return ""
+    
+    def extraer(self, ruta: str) -> str:
+        """Como leer(), pero lanza la excepción si falla."""
+        return '\n'.join(self._parrafos(ruta))
 
 
 class LectorXLSX(LectorArchivo):
@@ -115,49 +439,69 @@ class LectorXLSX(LectorArchivo):
     def puede_leer(self, extension: str) -> bool:
         return extension.lower() in {'.xlsx', '.xls'}
     
-    def leer(self, ruta: str) -> str:
-        """Extrae contenido de todas las hojas y celdas."""
+    def _filas(self, ruta: str) -> Iterator[str]:
+        """Recorre las filas de todas las hojas; cada fila como texto en minúsculas."""
+        openpyxl = _requerir('openpyxl')
+        wb = openpyxl.load_workbook(ruta, read_only=True, data_only=True)
         try:
-            from openpyxl import load_workbook
-            wb = load_workbook(ruta, read_only=True, data_only=True)
-            texto = ''
-            
             for sheet in wb.worksheets:
                 for row in sheet.iter_rows(values_only=True):
-                    for cell in row:
-                        if cell is not None:
-                            texto += str(cell) + ' '
-                    texto += '\n'
-            
+                    yield ''.join(str(cell) + ' ' for cell in row if cell is not None).lower()
+        finally:
             wb.close()
-            return texto.lower()
+    
+    def leer(self, ruta: str) -> str:
+        """Extrae contenido de todas las hojas y celdas."""
+        try:
+            return self.extraer(ruta)
         except Exception as e:
             print(f"Error leyendo XLSX {ruta}: {e}")
             return ""
+    
+    def extraer(self, ruta: str) -> str:
+        """Como leer(), pero lanza la excepción si falla."""
+        return ''.join(fila + '\n' for fila in self._filas(ruta))
 
 
 class LectorPPTX(LectorArchivo):
-    """Lector para presentaciones PowerPoint (.pptx)."""
+    """
+    Lector para presentaciones PowerPoint (.pptx).
+    Lee ppt/slides/slideN.xml directamente del ZIP, sin python-pptx.
+    """
+    
+    # Espacio de nombres de DrawingML, donde está el texto de las formas
+    _A = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+    
+    # Diapositivas dentro del ZIP; el número da el orden
+    _DIAPOSITIVA = re.compile(r'ppt/slides/slide(\d+)\.xml')
     
     def puede_leer(self, extension: str) -> bool:
         return extension.lower() == '.pptx'
     
+    def _textos(self, ruta: str) -> Iterator[str]:
+        """Recorre los párrafos de cada diapositiva, en orden, en minúsculas."""
+        with zipfile.ZipFile(ruta) as z:
+            diapositivas = []
+            for nombre in z.namelist():
+                m = self._DIAPOSITIVA.fullmatch(nombre)
+                if m:
+                    diapositivas.append((int(m.group(1)), nombre))
+            
+            for _, nombre in sorted(diapositivas):
+                with z.open(nombre) as xml:
+                    yield from _parrafos_xml(xml, self._A + 'p', self._A + 't')
+    
     def leer(self, ruta: str) -> str:
         """Extrae texto de todas las diapositivas."""
         try:
-            from pptx import Presentation
-            prs = Presentation(ruta)
-            texto = ''
-            
-            for slide in prs.slides:
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        texto += shape.text + '\n'
-            
-            return texto.lower()
+            return self.extraer(ruta)
         except Exception as e:
             print(f"Error leyendo PPTX {ruta}: {e}")
             return ""
+    
+    def extraer(self, ruta: str) -> str:
+        """Como leer(), pero lanza la excepción si falla."""
+        return ''.join(t + '\n' for t in self._textos(ruta))
 
 
 class LectorGenerico(LectorArchivo):
@@ -195,6 +539,10 @@ class LectorFactory:
         LectorGenerico()  # SIEMPRE al final como fallback
     ]
     
+    # Lector ya elegido para cada extensión: evita recorrer la lista
+    # de lectores por cada archivo de la búsqueda por contenido
+    _por_extension: Dict[str, LectorArchivo] = {}
+    
     @classmethod
     def crear_lector(cls, ruta: str) -> LectorArchivo:
         """
@@ -213,13 +561,33 @@ class LectorFactory:
         """
         extension = os.path.splitext(ruta)[1].lower()
         
+        lector = cls._por_extension.get(extension)
+        if lector is not None:
+            return lector
+        
         # Buscar el primer lector que pueda manejar esta extensión
         for lector in cls._lectores:
             if lector.puede_leer(extension):
-                return lector
+                break
+        else:
+            # Fallback (nunca debería llegar aquí por LectorGenerico)
+            lector = LectorGenerico()
         
-        # Fallback (nunca debería llegar aquí por LectorGenerico)
-        return LectorGenerico()
+        cls._por_extension[extension] = lector
+        return lector
+    
+    @classmethod
+    def tiene_lector(cls, extension: str) -> bool:
+        """
+        Indica si algún lector específico (no el genérico) maneja la extensión.
+        
+        Args:
+            extension: Extensión del archivo (ej: '.pdf')
+            
+        Returns:
+            True si vale la pena leer archivos con esa extensión
+        """
+        return not isinstance(cls.crear_lector('archivo' + extension), LectorGenerico)
     
     @classmethod
     def registrar_lector(cls, lector: LectorArchivo, posicion: int = -1):
@@ -246,6 +614,11 @@ class LectorFactory:
             cls._lectores.insert(len(cls._lectores) - 1, lector)
         else:
             cls._lectores.insert(posicion, lector)
+        
+        # El nuevo lector puede tener prioridad sobre los ya elegidos, y el
+        # contenido cacheado pudo haberse leído con otro lector
+        cls._por_extension.clear()
+        limpiar_cache_contenido()
     
     @classmethod
     def obtener_extensiones_soportadas(cls) -> set:
@@ -276,13 +649,237 @@ class LectorFactory:
         return extensiones
 
 
-# FUNCIÓN DE CONVENIENCIA (para usar en tu código existente)
+# CACHÉ DE CONTENIDO
+
+# Caracteres de contenido que se conservan en memoria como máximo
+MAX_TAMANIO_CACHE = 256 * 1024 * 1024
+
+# Caracteres de contenido que se guardan en disco al cerrar como máximo
+# (los usados más recientemente); guardar todo el caché tardaría demasiado
+MAX_TAMANIO_CACHE_ARCHIVO = 64 * 1024 * 1024
+
+# Archivos más grandes que esto no se leen (evita parsear documentos enormes)
+MAX_TAMANIO_CONTENIDO = 10 * 1024 * 1024
+
+# Archivos que la búsqueda por contenido lee a la vez; más no aceleran un USB
+# o un disco mecánico, que es donde se busca
+MAX_HILOS_CONTENIDO = 4
+
+# Archivos enviados al pool a la vez en la búsqueda por contenido
+MAX_ARCHIVOS_EN_VUELO = 256
+
+# Resultados de búsqueda en texto plano que se conservan como máximo
+MAX_VEREDICTOS = 50000
+
+
+class CacheContenido:
+    """
+    Caché LRU del texto extraído de cada archivo.
+    - Limitada por el total de caracteres guardados, no por cantidad de archivos
+    - La clave incluye fecha de modificación y tamaño: si el archivo cambia
+      se vuelve a leer automáticamente
+    - Segura para usar desde el pool de hilos de la búsqueda por contenido
+    - Se puede guardar en disco y volver a cargar en otra sesión
+    """
+    
+    # Formato del archivo guardado; cambiarlo invalida los archivos anteriores
+    # (también si cambia lo que un lector extrae de un formato)
+    VERSION_ARCHIVO = 2
+    
+    def __init__(self, max_tamanio: int):
+        """
+        Args:
+            max_tamanio: Total de caracteres a partir del cual se descartan
+                         los contenidos usados hace más tiempo
+        """
+        self.max_tamanio = max_tamanio
+        self._contenidos: OrderedDict = OrderedDict()
+        self._tamanio = 0
+        self._lock = threading.Lock()
+    
+    def obtener(self, clave):
+        """Retorna el contenido memorizado o None si no está."""
+        with self._lock:
+            contenido = self._contenidos.get(clave)
+            if contenido is not None:
+                self._contenidos.move_to_end(clave)
+            return contenido
+    
+    def guardar(self, clave, contenido: str):
+        """Memoriza un contenido, descartando los más antiguos si no hay lugar."""
+        if len(contenido) > self.max_tamanio:
+            return
+        
+        with self._lock:
+            anterior = self._contenidos.pop(clave, None)
+            if anterior is not None:
+                self._tamanio -= len(anterior)
+            
+            self._contenidos[clave] = contenido
+            self._tamanio += len(contenido)
+            
+            while self._tamanio > self.max_tamanio:
+                _, descartado = self._contenidos.popitem(last=False)
+                self._tamanio -= len(descartado)
+    
+    def limpiar(self):
+        """Descarta todo el contenido memorizado."""
+        with self._lock:
+            self._contenidos.clear()
+            self._tamanio = 0
+    
+    def guardar_archivo(self, ruta_archivo: str, max_tamanio: Optional[int] = None):
+        """
+        Guarda el contenido memorizado en disco, del más antiguo al más reciente.
+        
+        Se escribe en un archivo temporal y luego se reemplaza, así una
+        escritura interrumpida no deja un archivo a medias.
+        
+        Args:
+            ruta_archivo: Archivo de destino
+            max_tamanio: Total de caracteres a guardar como máximo, empezando
+                         por los contenidos usados más recientemente.
+                         None = guardar todo
+        """
+        with self._lock:
+            entradas = list(self._contenidos.items())
+        
+        if max_tamanio is not None:
+            total = 0
+            desde = len(entradas)
+            while desde > 0 and total + len(entradas[desde - 1][1]) <= max_tamanio:
+                desde -= 1
+                total += len(entradas[desde][1])
+            entradas = entradas[desde:]
+        
+        temporal = ruta_archivo + '.tmp'
+        with open(temporal, 'wb') as f:
+            pickle.dump((self.VERSION_ARCHIVO, entradas), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta_archivo)
+    
+    def cargar_archivo(self, ruta_archivo: str):
+        """
+        Agrega el contenido guardado con guardar_archivo().
+        
+        Las entradas de archivos que cambiaron desde entonces no molestan:
+        su clave ya no coincide y el LRU termina descartándolas.
+        
+        Args:
+            ruta_archivo: Archivo guardado previamente
+        """
+        with open(ruta_archivo, 'rb') as f:
+            version, entradas = pickle.load(f)
+        
+        if version != self.VERSION_ARCHIVO:
+            return
+        
+        for clave, contenido in entradas:
+            self.guardar(clave, contenido)
+
+
+class CacheVeredictos:
+    """
+    Caché LRU de resultados de búsqueda (True/False) por archivo y texto.
+    
+    Es para los lectores con USAR_CACHE = False (texto plano), cuyo
+    contenido no se memoriza: repetir una búsqueda no vuelve a leerlos.
+    Limitada por cantidad de entradas y segura para el pool de hilos.
+    """
+    
+    def __init__(self, max_entradas: int):
+        """
+        Args:
+            max_entradas: Cantidad a partir de la cual se descartan los
+                          resultados usados hace más tiempo
+        """
+        self.max_entradas = max_entradas
+        self._veredictos: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def obtener(self, clave) -> Optional[bool]:
+        """Retorna el resultado memorizado o None si no está."""
+        with self._lock:
+            veredicto = self._veredictos.get(clave)
+            if veredicto is not None:
+                self._veredictos.move_to_end(clave)
+            return veredicto
+    
+    def guardar(self, clave, veredicto: bool):
+        """Memoriza un resultado, descartando el más antiguo si no hay lugar."""
+        with self._lock:
+            self._veredictos[clave] = veredicto
+            self._veredictos.move_to_end(clave)
+            if len(self._veredictos) > self.max_entradas:
+                self._veredictos.popitem(last=False)
+    
+    def limpiar(self):
+        """Descarta todos los resultados memorizados."""
+        with self._lock:
+            self._veredictos.clear()
+
+
+_cache_contenido = CacheContenido(MAX_TAMANIO_CACHE)
+_cache_veredictos = CacheVeredictos(MAX_VEREDICTOS)
+
+
+def _leer_contenido_cacheado(ruta: str, firma: Tuple[int, int], lector: LectorArchivo,
+                             extraer: Optional[Callable[[str], str]] = None) -> str:
+    """
+    Lee el contenido de un archivo con el lector dado y lo memoriza.
+    
+    Solo se memoriza una extracción exitosa: si falla, la excepción sigue
+    hacia quien llama y el archivo se vuelve a intentar en otra búsqueda.
+    
+    Args:
+        ruta: Ruta completa del archivo
+        firma: (st_mtime_ns, st_size) del archivo
+        lector: Lector apropiado para el archivo
+        extraer: Función que extrae el contenido en lugar de lector.extraer
+                 (ej: en otro proceso); debe lanzar la excepción si falla.
+                 None = usar el lector
+        
+    Returns:
+        Contenido del archivo en minúsculas
+    """
+    clave = (ruta, *firma)
+    contenido = _cache_contenido.obtener(clave)
+    
+    if contenido is None:
+        contenido = extraer(ruta) if extraer else lector.extraer(ruta)
+        _cache_contenido.guardar(clave, contenido)
+    
+    return contenido
+
+
+def limpiar_cache_contenido():
+    """Descarta todo el contenido memorizado (por ejemplo, al cambiar de unidad)."""
+    _cache_contenido.limpiar()
+    _cache_veredictos.limpiar()
+
+
+def guardar_cache_contenido(ruta_archivo: str):
+    """Guarda el contenido más reciente para la próxima sesión (hasta MAX_TAMANIO_CACHE_ARCHIVO)."""
+    _cache_contenido.guardar_archivo(ruta_archivo, MAX_TAMANIO_CACHE_ARCHIVO)
+
+
+def cargar_cache_contenido(ruta_archivo: str):
+    """Carga el contenido memorizado en otra sesión, si existe."""
+    if os.path.exists(ruta_archivo):
+        _cache_contenido.cargar_archivo(ruta_archivo)
+
+
+# FUNCIONES DE CONVENIENCIA (para usar en tu código existente)
 
 def leer_contenido_archivo(ruta: str) -> str:
     """
     Lee el contenido de un archivo usando Factory Pattern.
     
     Esta función reemplaza tu función anterior y es mucho más simple.
+    El resultado se memoriza por (ruta, fecha de modificación, tamaño):
+    las búsquedas repetidas sobre la misma unidad no vuelven a parsear
+    los documentos. Los archivos de más de MAX_TAMANIO_CONTENIDO bytes
+    se omiten.
     
     Args:
         ruta: Ruta completa del archivo a leer
@@ -296,17 +893,144 @@ def leer_contenido_archivo(ruta: str) -> str:
         True
     """
     try:
+        info = os.stat(ruta)
+        
+        if info.st_size > MAX_TAMANIO_CONTENIDO:
+            return ""
+        
         # El Factory decide qué lector usar
         lector = LectorFactory.crear_lector(ruta)
-        
-        # El lector hace su trabajo
-        return lector.leer(ruta)
+        return _leer_contenido_cacheado(ruta, (info.st_mtime_ns, info.st_size), lector)
         
     except Exception as e:
         print(f"Error leyendo archivo {ruta}: {e}")
         return ""
 
 
+def extraer_contenido(ruta: str) -> str:
+    """
+    Extrae el contenido de un archivo sin pasar por el caché.
+    
+    Es una función de módulo para poder ejecutarla en un
+    ProcessPoolExecutor: el parseo de documentos es Python puro y dentro
+    de un hilo no avanza en paralelo por el GIL. El contenido vuelve al
+    proceso principal, que es quien lo memoriza. Si la extracción falla,
+    la excepción vuelve con el resultado y no se memoriza nada.
+    
+    Args:
+        ruta: Ruta completa del archivo
+        
+    Returns:
+        Contenido del archivo en minúsculas
+    """
+    return LectorFactory.crear_lector(ruta).extraer(ruta)
+
+
+def contiene_texto(ruta: str, texto: str,
+                   extraer: Optional[Callable[[str], str]] = None,
+                   firma: Optional[Tuple[int, int]] = None) -> bool:
+    """
+    Verifica si un archivo contiene un texto, usando el lector apropiado.
+    
+    Los documentos (PDF, Word, Excel, PowerPoint) se buscan sobre el
+    contenido memorizado, así que refinar la búsqueda no vuelve a
+    parsearlos. Los lectores con USAR_CACHE = False (texto plano) se
+    detienen en la primera coincidencia sin extraer el archivo completo;
+    de ellos se memoriza solo el resultado, por archivo y texto buscado.
+    
+    Con la firma tomada al indexar no hace falta un os.stat por archivo
+    en cada búsqueda; un cambio posterior se detecta al volver a indexar.
+    
+    Args:
+        ruta: Ruta completa del archivo
+        texto: Texto a buscar, en minúsculas
+        extraer: Cómo extraer un documento que no está en el caché
+                 (ej: enviarlo a otro proceso). None = en este hilo
+        firma: (st_mtime_ns, st_size) del archivo, ej: IndiceArchivos.firma().
+               None = consultarla con os.stat
+        
+    Returns:
+        True si el archivo contiene el texto, False si no o si hay error
+    """
+    try:
+        if firma is None:
+            info = os.stat(ruta)
+            firma = (info.st_mtime_ns, info.st_size)
+        
+        if firma[1] > MAX_TAMANIO_CONTENIDO:
+            return False
+        
+        lector = LectorFactory.crear_lector(ruta)
+        
+        if not lector.USAR_CACHE:
+            clave = (ruta, *firma, texto)
+            veredicto = _cache_veredictos.obtener(clave)
+            if veredicto is None:
+                veredicto = lector.contiene(ruta, texto)
+                _cache_veredictos.guardar(clave, veredicto)
+            return veredicto
+        
+        return texto in _leer_contenido_cacheado(ruta, firma, lector, extraer)
+        
+    except Exception as e:
+        print(f"Error leyendo archivo {ruta}: {e}")
+        return False
+
+
+def buscar_en_paralelo(pool: Executor, indice, candidatos: Iterable[int], texto: str,
+                       extraer: Optional[Callable[[str], str]] = None,
+                       max_en_vuelo: int = MAX_ARCHIVOS_EN_VUELO
+                       ) -> Iterator[Tuple[int, List[int]]]:
+    """
+    Busca un texto en los archivos candidatos repartiéndolos en un pool.
+    
+    Solo hay max_en_vuelo archivos enviados a la vez (cada uno que termina
+    deja lugar al siguiente): la memoria no crece con la unidad y, si la
+    búsqueda se abandona, hay pocas lecturas pendientes. Al dejar de
+    iterar (break o return) se cancelan las que todavía no empezaron.
+    
+    Args:
+        pool: Pool de hilos donde se ejecuta contiene_texto()
+        indice: IndiceArchivos con las rutas y firmas de los candidatos
+        candidatos: Posiciones en el índice de los archivos a revisar, en orden
+        texto: Texto a buscar, en minúsculas
+        extraer: Se pasa a contiene_texto(). None = extraer en el mismo hilo
+        max_en_vuelo: Archivos enviados al pool a la vez como máximo
+        
+    Returns:
+        Iterador de (terminados, coincidencias) por cada tanda de archivos
+        que termina: cuántos terminaron y las posiciones de los que
+        contienen el texto, en el orden en que terminaron
+    """
+    rutas = indice.rutas
+    por_enviar = iter(candidatos)
+    futuros = {}
+    
+    def enviar(cantidad: int):
+        for idx in islice(por_enviar, cantidad):
+            futuro = pool.submit(contiene_texto, rutas[idx], texto, extraer, indice.firma(idx))
+            futuros[futuro] = idx
+    
+    try:
+        enviar(max_en_vuelo)
+        
+        while futuros:
+            terminados, _ = wait(futuros, return_when=FIRST_COMPLETED)
+            
+            coincidencias = []
+            for futuro in terminados:
+                idx = futuros.pop(futuro)
+                # contiene_texto() ya atrapa los errores de lectura
+                if futuro.result():
+                    coincidencias.append(idx)
+            
+            enviar(len(terminados))
+            yield len(terminados), coincidencias
+    finally:
+        for pendiente in futuros:
+            pendiente.cancel()
+
+
 # EJEMPLO DE USO Y PRUEBAS
 
 if __name__ == '__main__':
@@ -1,24 +1,36 @@
 import os
 import sys
+import ctypes.wintypes
+import stat
 import string
 import threading
 import subprocess
 import platform
-from typing import List, Dict, Optional
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Optional, Sequence
+import win32api
 import win32file
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QListWidget, QLabel, QMessageBox, 
+    QPushButton, QLineEdit, QLabel, QMessageBox, 
     QFrame, QCompleter, QTextEdit
 )
-from PyQt5.QtCore import Qt, QTimer, QStringListModel, pyqtSignal, QObject
+from PyQt5.QtCore import Qt, QTimer, QModelIndex, pyqtSignal, QObject
 from PyQt5.QtGui import QFont
 
 from ventana import VentanaBase
+from modelos import ModeloLista
 from GestorHistorial import GestorHistorial
+from IndiceArchivos import IndiceArchivos
 from ventana_instrucciones import VentanaInstrucciones
 from lectores import leer_contenido_archivo as leer_contenido_archivo_factory
+from lectores import buscar_en_paralelo, extraer_contenido, LectorFactory
+from lectores import MAX_TAMANIO_CONTENIDO, MAX_HILOS_CONTENIDO
+from lectores import guardar_cache_contenido, cargar_cache_contenido
 
 
 # ========== CONSTANTES ==========
@@ -30,35 +42,69 @@ EXTENSIONES_TEXTO = {
 
 ENCODINGS_TEXTO = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
 
+# Sistema operativo, para elegir cómo abrir archivos (no cambia en ejecución)
+SISTEMA = platform.system()
+
+# Carpetas ocultas y de sistema (System Volume Information, $RECYCLE.BIN...)
+ATRIBUTOS_CARPETA_SISTEMA = stat.FILE_ATTRIBUTE_HIDDEN | stat.FILE_ATTRIBUTE_SYSTEM
+
+# Mensaje de Windows al conectar/desconectar dispositivos y sus eventos de interés
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+
+# Carpeta donde se guarda el índice de cada unidad entre sesiones
+CARPETA_INDICES = os.path.join(
+    os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), 'BuscadorArchivos'
+)
+
+# Texto extraído de los documentos, guardado entre sesiones
+ARCHIVO_CACHE_CONTENIDO = os.path.join(CARPETA_INDICES, 'contenido.pkl')
+
 
 # ========== SEÑALES ==========
 
 class Signals(QObject):
     """Señales para comunicación thread-safe."""
     progreso_actualizado = pyqtSignal(int, int, int)
-    busqueda_finalizada = pyqtSignal(list, str)
+    busqueda_finalizada = pyqtSignal(object, list, str)
     error_busqueda = pyqtSignal(str)
+    coincidencias_parciales = pyqtSignal(int, list)
+    indexacion_parcial = pyqtSignal(int, int, list)
+    indexacion_completa = pyqtSignal(int, object)
+    resultados_nombre = pyqtSignal(int, object, list, str)
 
 
 # ========== FUNCIONES AUXILIARES ==========
 
-def detectar_unidades_disponibles() -> List[Dict[str, str]]:
-    """Detecta unidades extraíbles USB."""
+def detectar_unidades_disponibles(mascara: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    Detecta unidades extraíbles USB.
+    
+    Args:
+        mascara: Máscara de GetLogicalDrives (bit 0 = A:, bit 1 = B:, ...).
+                 None = consultarla aquí
+    """
     unidades = []
     
-    for letra in string.ascii_uppercase:
+    if mascara is None:
+        mascara = win32file.GetLogicalDrives()
+    
+    for posicion, letra in enumerate(string.ascii_uppercase):
+        # Letras sin unidad montada: ni siquiera se consultan
+        if not mascara & (1 << posicion):
+            continue
+        
         unidad = f"{letra}:\\"
         
         if letra in ['A', 'B', 'C']:
             continue
         
-        if not os.path.exists(unidad):
-            continue
-        
         try:
             tipo_unidad = win32file.GetDriveType(unidad)
             
-            if tipo_unidad == 2:
+            # Solo se pregunta por las candidatas (ej: lector de tarjetas sin tarjeta)
+            if tipo_unidad == 2 and os.path.exists(unidad):
                 unidades.append({
                     'texto': f"{letra}:/", 
                     'ruta': unidad
@@ -69,6 +115,45 @@ def detectar_unidades_disponibles() -> List[Dict[str, str]]:
     return unidades
 
 
+def es_carpeta_sistema(entrada: os.DirEntry) -> bool:
+    """
+    Indica si una carpeta es oculta y de sistema en Windows.
+    
+    En Windows, DirEntry.stat() usa los atributos que FindNextFileW ya
+    devolvió al listar la carpeta, así que no hace otra llamada al sistema.
+    
+    Args:
+        entrada: Entrada de os.scandir que es una carpeta
+    """
+    if os.name != 'nt':
+        return False
+    
+    atributos = entrada.stat(follow_symlinks=False).st_file_attributes
+    return atributos & ATRIBUTOS_CARPETA_SISTEMA == ATRIBUTOS_CARPETA_SISTEMA
+
+
+def ruta_indice_guardado(raiz: str) -> Optional[str]:
+    """
+    Archivo donde se guarda el índice de una unidad.
+    
+    La unidad se identifica por el número de serie del volumen, que no
+    cambia aunque Windows le asigne otra letra al reconectarla.
+    
+    Args:
+        raiz: Ruta raíz de la unidad (ej: 'E:\\')
+        
+    Returns:
+        Ruta del archivo, o None si no se pudo leer el número de serie
+    """
+    try:
+        serie = win32api.GetVolumeInformation(raiz)[1] & 0xFFFFFFFF
+    except Exception as e:
+        print(f"Error leyendo número de serie de {raiz}: {e}")
+        return None
+    
+    return os.path.join(CARPETA_INDICES, f"indice_{serie:08X}.pkl")
+
+
 def leer_contenido_archivo(ruta: str) -> str:
     """
     Lee contenido de un archivo usando Factory Pattern.
@@ -87,9 +172,14 @@ def leer_contenido_archivo(ruta: str) -> str:
 class BuscadorArchivos(VentanaBase):
     """Clase principal del buscador - Versión estable."""
     
-    INTERVALO_DETECCION_USB = 2000
+    # Respaldo hasta recibir el primer WM_DEVICECHANGE; normalmente avisa Windows
+    INTERVALO_DETECCION_USB = 10000
     DELAY_BUSQUEDA_VIVO = 500
-    MAX_ARCHIVOS_MOSTRADOS = 200
+    # Cada proceso atiende a un hilo de pool_contenido; más quedarían ociosos
+    MAX_PROCESOS_DOCUMENTOS = max(1, min(MAX_HILOS_CONTENIDO, (os.cpu_count() or 2) - 1))
+    MAX_HILOS_INDEXADO = min(8, os.cpu_count() or 1)
+    MAX_INDICES_EN_MEMORIA = 4
+    TAMANIO_LOTE_INDEXADO = 2000
     
     BUSQUEDA_NOMBRE = 1
     BUSQUEDA_EXTENSION = 2
@@ -101,23 +191,82 @@ class BuscadorArchivos(VentanaBase):
         
         # Estado
         self.unidad_seleccionada = None
-        self.resultados = []
-        self.todos_los_archivos = []
+        # Los resultados son posiciones dentro de self.indice
+        self.resultados: Sequence[int] = []
+        self.indice = IndiceArchivos()
         self.unidades_previas = []
+        self.mascara_unidades = 0
         self.tipo_busqueda = self.BUSQUEDA_NOMBRE
         self.buscando_contenido = False
         
+        # Pool reutilizado entre búsquedas por contenido: la lectura y el
+        # parseo liberan el GIL, así varias lecturas quedan en cola en la unidad
+        self.pool_contenido = ThreadPoolExecutor(
+            max_workers=MAX_HILOS_CONTENIDO,
+            thread_name_prefix="contenido"
+        )
+        
+        # Cada indexación recibe un número de generación; un hilo cuya
+        # generación ya no es la actual fue cancelado y descarta su trabajo
+        self.generacion_indexado = 0
+        
+        # Últimos índices publicados, por archivo de índice (número de serie
+        # del volumen); volver a una unidad los muestra sin leer el disco
+        self.indices_en_memoria = OrderedDict()
+        self.clave_indice = None
+        
+        # Pool reutilizado entre indexaciones: cada carpeta de la raíz se
+        # recorre en su propio hilo y se solapa la espera de la unidad
+        self.pool_indexado = ThreadPoolExecutor(
+            max_workers=self.MAX_HILOS_INDEXADO,
+            thread_name_prefix="indexado"
+        )
+        
+        # Lo mismo para la búsqueda por contenido: al cambiar de unidad la
+        # búsqueda en curso se abandona y sus lecturas pendientes se cancelan
+        self.generacion_contenido = 0
+        
+        # Procesos para parsear PDF, Word, Excel y PowerPoint en paralelo de
+        # verdad (Python puro, sujeto al GIL en hilos); se crean al primer uso
+        self.pool_documentos = None
+        self.candado_documentos = threading.Lock()
+        
+        # Las búsquedas por nombre y extensión corren en un solo hilo aparte;
+        # cada tecla cambia la generación y las búsquedas viejas se descartan
+        self.pool_nombres = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="nombres"
+        )
+        self.generacion_nombres = 0
+        
+        # (texto, índice) de la búsqueda por nombre que está en pantalla
+        self.consulta_mostrada = None
+        # Texto (con @) de la búsqueda por contenido en curso o en pantalla
+        self.consulta_contenido = None
+        
         # Señales
         self.signals = Signals()
         self.signals.progreso_actualizado.connect(self._on_progreso_actualizado)
         self.signals.busqueda_finalizada.connect(self._on_busqueda_finalizada)
         self.signals.error_busqueda.connect(self._on_error_busqueda)
+        self.signals.coincidencias_parciales.connect(self._on_coincidencias_parciales)
+        self.signals.indexacion_parcial.connect(self._on_indexacion_parcial)
+        self.signals.indexacion_completa.connect(self._on_indexacion_completa)
+        self.signals.resultados_nombre.connect(self._on_resultados_nombre)
         
         # Historial
         self.historial = GestorHistorial()
         self.completer = None
+        self.ventana_instrucciones = None
+        self.modelo_historial = None
         self.historial.limpiar()
         
+        # El texto de los documentos de sesiones anteriores se carga sin
+        # frenar la apertura de la ventana; las búsquedas por contenido y el
+        # guardado al cerrar esperan a que termine
+        self.cache_contenido_cargado = threading.Event()
+        threading.Thread(target=self._cargar_cache_contenido, daemon=True).start()
+        
         # Inicializar UI
         self.init_ui()
         self.cargar_unidades()
@@ -135,10 +284,49 @@ class BuscadorArchivos(VentanaBase):
         self.timer_autocompletar.setSingleShot(True)
         self.timer_autocompletar.timeout.connect(self._ejecutar_busqueda_diferida)
     
+    def _cargar_cache_contenido(self):
+        """Carga el caché de contenido guardado en la sesión anterior."""
+        try:
+            cargar_cache_contenido(ARCHIVO_CACHE_CONTENIDO)
+        except Exception as e:
+            print(f"Error cargando caché de contenido: {e}")
+        finally:
+            self.cache_contenido_cargado.set()
+    
+    def _guardar_cache_contenido(self):
+        """Guarda el caché de contenido una vez terminada la carga inicial."""
+        try:
+            self.cache_contenido_cargado.wait()
+            os.makedirs(CARPETA_INDICES, exist_ok=True)
+            guardar_cache_contenido(ARCHIVO_CACHE_CONTENIDO)
+        except Exception as e:
+            print(f"Error guardando caché de contenido: {e}")
+    
+    def closeEvent(self, event):
+        """Guarda el caché de contenido para no volver a parsear los documentos."""
+        # En un hilo aparte para que la ventana cierre sin esperar; no es
+        # daemon, así el proceso no termina hasta que el archivo se escribe
+        threading.Thread(target=self._guardar_cache_contenido).start()
+        
+        # Los hilos de los pools no son daemon: Python los espera al salir.
+        # Cambiar las generaciones corta los recorridos y lecturas en curso,
+        # y el trabajo que sigue en cola se descarta sin empezar
+        self.generacion_indexado += 1
+        self.generacion_contenido += 1
+        self.generacion_nombres += 1
+        for pool in (self.pool_indexado, self.pool_contenido, self.pool_nombres):
+            pool.shutdown(wait=False, cancel_futures=True)
+        if self.pool_documentos is not None:
+            self.pool_documentos.shutdown(wait=False, cancel_futures=True)
+        
+        super().closeEvent(event)
+    
     def mostrar_ventana_instrucciones(self):
         """Muestra ventana de instrucciones."""
         try:
-            self.ventana_instrucciones = VentanaInstrucciones(self)
+            # Se crea una sola vez; al cerrarla solo se oculta y se vuelve a mostrar
+            if self.ventana_instrucciones is None:
+                self.ventana_instrucciones = VentanaInstrucciones(self)
             self.ventana_instrucciones.mostrar()
         except:
             pass
@@ -182,6 +370,10 @@ class BuscadorArchivos(VentanaBase):
                 }
             """)
             
+            # Modelo único: se asigna una vez y solo se actualizan sus datos
+            self.modelo_historial = ModeloLista(self.completer)
+            self.completer.setModel(self.modelo_historial)
+            
             self.search_input.setCompleter(self.completer)
             
             # Conectar evento de focus para mostrar historial al hacer clic
@@ -194,10 +386,8 @@ class BuscadorArchivos(VentanaBase):
     def actualizar_completer(self):
         """Actualiza completer."""
         try:
-            if self.completer:
-                model = QStringListModel()
-                model.setStringList(self.historial.obtener_todos())
-                self.completer.setModel(model)
+            if self.modelo_historial:
+                self.modelo_historial.establecer(self.historial.obtener_todos())
         except:
             pass
     
@@ -222,6 +412,9 @@ class BuscadorArchivos(VentanaBase):
             
             texto = self.search_input.text()
             
+            # La búsqueda por nombre pendiente ya no corresponde al texto
+            self.generacion_nombres += 1
+            
             # Detectar tipo
             self._detectar_tipo_busqueda(texto)
             
@@ -231,7 +424,7 @@ class BuscadorArchivos(VentanaBase):
             # Si vacío, mostrar todo
             if not texto.strip():
                 self.timer_autocompletar.stop()
-                if self.unidad_seleccionada and self.todos_los_archivos:
+                if self.unidad_seleccionada and len(self.indice):
                     QTimer.singleShot(50, self.mostrar_todos_los_archivos)
                 return
             
@@ -282,32 +475,53 @@ class BuscadorArchivos(VentanaBase):
             for info in unidades:
                 btn = QPushButton(info['texto'])
                 btn.setFixedHeight(60)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2B313F; 
-                        color: white;
-                        font-size: 20px;
-                        font-weight: bold;
-                        border: 2px solid #E32D64;
-                        border-radius: 15px;
-                    } 
-                    QPushButton:hover { 
-                        background-color: #4a4a4c; 
-                    }
-                    QPushButton:pressed {
-                        background-color: #E32D64;
-                    }
-                """)
+                # Estilo compartido en VentanaBase.HOJA_ESTILOS
+                btn.setObjectName("btn_unidad")
                 btn.setCursor(Qt.PointingHandCursor)
                 btn.clicked.connect(lambda _, i=info: self.seleccionar_unidad(i))
                 self.units_layout.addWidget(btn)
         except Exception as e:
             print(f"Error cargando unidades: {e}")
     
+    def nativeEvent(self, tipo_evento, mensaje):
+        """
+        Recibe los mensajes de Windows de la ventana.
+        
+        Al conectar o quitar una unidad, Windows envía WM_DEVICECHANGE a las
+        ventanas principales: la detección se hace en ese momento, sin
+        esperar al siguiente sondeo del timer. Con el primer aviso recibido
+        queda comprobado que llegan, y el timer de respaldo se detiene.
+        """
+        try:
+            if tipo_evento == b"windows_generic_MSG":
+                msg = ctypes.wintypes.MSG.from_address(int(mensaje))
+                if (msg.message == WM_DEVICECHANGE
+                        and msg.wParam in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE)):
+                    # Fuera del manejador nativo, en la próxima vuelta del event loop
+                    QTimer.singleShot(0, self.verificar_cambios_usb)
+                    
+                    # Los avisos llegan: ya no hace falta despertar cada pocos segundos
+                    if self.timer_usb.isActive():
+                        self.timer_usb.stop()
+        except Exception as e:
+            print(f"Error procesando mensaje de Windows: {e}")
+        
+        return super().nativeEvent(tipo_evento, mensaje)
+    
     def verificar_cambios_usb(self):
-        """Verifica cambios en USB."""
+        """
+        Verifica cambios en USB.
+        
+        Cada sondeo compara solo la máscara de GetLogicalDrives (una
+        llamada); la detección completa se hace únicamente si cambió.
+        """
         try:
-            actuales = detectar_unidades_disponibles()
+            mascara = win32file.GetLogicalDrives()
+            if mascara == self.mascara_unidades:
+                return
+            self.mascara_unidades = mascara
+            
+            actuales = detectar_unidades_disponibles(mascara)
             letras_actuales = {u['texto'] for u in actuales}
             letras_previas = {u['texto'] for u in self.unidades_previas}
             
@@ -319,10 +533,12 @@ class BuscadorArchivos(VentanaBase):
                     
                     # Si la unidad seleccionada ya no está disponible
                     if letra_seleccionada not in letras_actuales:
-                        # Limpiar resultados y estado
+                        # Cancelar la indexación y la búsqueda en curso y limpiar estado
+                        self.generacion_indexado += 1
+                        self._cancelar_busqueda_contenido()
                         self.unidad_seleccionada = None
                         self.resultados = []
-                        self.todos_los_archivos = []
+                        self.indice = IndiceArchivos()
                         self.mostrar_mensaje_inicial()
                 
                 self.cargar_unidades()
@@ -334,76 +550,331 @@ class BuscadorArchivos(VentanaBase):
     # ========== INDEXACIÓN ==========
     
     def seleccionar_unidad(self, unidad: Dict[str, str]):
-        """Selecciona unidad."""
+        """Selecciona unidad y cancela cualquier indexación previa."""
         try:
             self.unidad_seleccionada = unidad['ruta']
+            self.generacion_indexado += 1
+            self._cancelar_busqueda_contenido()
+            self.indice = IndiceArchivos()
+            self.resultados = []
+            
+            self._poblar_resultados([
+                "",
+                f"  Unidad seleccionada: {unidad['texto']}",
+                f"  Ruta: {unidad['ruta']}",
+                "",
+                "  Indexando archivos..."
+            ])
+            
+            self.clave_indice = ruta_indice_guardado(unidad['ruta'])
+            en_memoria = self.indices_en_memoria.get(self.clave_indice)
+            if en_memoria is not None:
+                self._on_indexacion_completa(self.generacion_indexado, en_memoria)
             
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem(f"  Unidad seleccionada: {unidad['texto']}")
-            self.results_list.addItem(f"  Ruta: {unidad['ruta']}")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Indexando archivos...")
-            
-            threading.Thread(target=self.indexar_unidad, daemon=True).start()
+            threading.Thread(
+                target=self.indexar_unidad,
+                args=(unidad['ruta'], self.generacion_indexado,
+                      self.clave_indice, en_memoria),
+                daemon=True
+            ).start()
         except Exception as e:
             print(f"Error seleccionando unidad: {e}")
     
-    def indexar_unidad(self):
-        """Indexa archivos."""
+    def indexar_unidad(self, raiz: str, generacion: int,
+                       archivo_indice: Optional[str],
+                       guardado: Optional[IndiceArchivos] = None):
+        """
+        Indexa los archivos de una unidad en un hilo secundario.
+        
+        Si la unidad ya se indexó antes (en memoria o en otra sesión), ese
+        índice se publica enseguida y el recorrido lo actualiza en segundo plano.
+        
+        Cada carpeta de la raíz se recorre en pool_indexado con su propio
+        IndiceArchivos; al terminar se unen en uno solo, que se publica en
+        el hilo de la interfaz mediante la señal indexacion_completa.
+        Mientras tanto, si no había índice guardado, cada recorrido envía
+        sus nombres nuevos con indexacion_parcial para que la lista se
+        vaya llenando. Si se seleccionó otra unidad, los recorridos se
+        abandonan. Al terminar, el índice se guarda en disco.
+        
+        Args:
+            raiz: Ruta raíz de la unidad a indexar
+            generacion: Generación de indexado asignada a este hilo
+            archivo_indice: Resultado de ruta_indice_guardado()
+            guardado: Índice en memoria ya publicado, o None para buscarlo en disco
+        """
         try:
-            self.todos_los_archivos = []
+            if guardado is None:
+                guardado = self._cargar_indice_guardado(archivo_indice)
+                
+                if guardado is not None and generacion == self.generacion_indexado:
+                    self.signals.indexacion_completa.emit(generacion, guardado)
+            
+            # Los archivos sueltos de la raíz se indexan aquí mismo
+            indice = IndiceArchivos()
+            carpetas = self._listar_carpeta(raiz, indice)
+            
+            avisar_avance = None
+            if guardado is None:
+                avisar_avance = self._crear_aviso_avance(generacion, len(indice))
+                if len(indice):
+                    self.signals.indexacion_parcial.emit(
+                        generacion, len(indice), list(indice.nombres)
+                    )
+            
+            futuros = [
+                self.pool_indexado.submit(
+                    self._recorrer_carpeta, carpeta, generacion, avisar_avance
+                )
+                for carpeta in carpetas
+            ]
             
-            if not self.unidad_seleccionada:
+            for futuro in futuros:
+                parcial = futuro.result()
+                if parcial is None:
+                    return
+                indice.unir(parcial)
+            
+            indice.finalizar()
+            
+            if generacion != self.generacion_indexado:
+                return
+            
+            # Si nada cambió desde la sesión anterior, el índice ya publicado sirve;
+            # las fechas también cuentan: la búsqueda por contenido usa la firma
+            if (guardado is not None and indice.rutas == guardado.rutas
+                    and indice.fechas == guardado.fechas
+                    and indice.tamanios == guardado.tamanios):
                 return
             
-            for root, dirs, files in os.walk(self.unidad_seleccionada):
-                for nombre_archivo in files:
+            self.signals.indexacion_completa.emit(generacion, indice)
+            
+            if archivo_indice:
+                try:
+                    os.makedirs(CARPETA_INDICES, exist_ok=True)
+                    indice.guardar(archivo_indice)
+                except Exception as e:
+                    print(f"Error guardando índice: {e}")
+        except Exception as e:
+            print(f"Error indexando: {e}")
+    
+    def _listar_carpeta(self, carpeta: str, indice: IndiceArchivos) -> List[str]:
+        """
+        Agrega al índice los archivos de una carpeta, sin entrar en las subcarpetas.
+        
+        os.scandir trae en cada DirEntry el nombre, la ruta, el tipo y (en
+        Windows) tamaño y fecha, sin un stat adicional por archivo.
+        
+        Args:
+            carpeta: Carpeta a listar
+            indice: Índice donde se agregan los archivos
+            
+        Returns:
+            Rutas de las subcarpetas a recorrer (sin las de sistema)
+        """
+        subcarpetas = []
+        
+        try:
+            with os.scandir(carpeta) as entradas:
+                for entrada in entradas:
                     try:
-                        ruta_completa = os.path.join(root, nombre_archivo)
-                        self.todos_los_archivos.append({
-                            'nombre': nombre_archivo,
-                            'ruta': ruta_completa,
-                            'extension': os.path.splitext(nombre_archivo)[1].lower()
-                        })
-                    except:
+                        if entrada.is_dir(follow_symlinks=False):
+                            if not es_carpeta_sistema(entrada):
+                                subcarpetas.append(entrada.path)
+                        elif entrada.is_file(follow_symlinks=False):
+                            nombre_archivo = entrada.name
+                            info = entrada.stat(follow_symlinks=False)
+                            indice.agregar(
+                                nombre_archivo,
+                                entrada.path,
+                                IndiceArchivos.extension_de(nombre_archivo),
+                                info.st_size,
+                                info.st_mtime_ns
+                            )
+                    except OSError:
                         continue
+        except OSError:
+            # Carpeta sin permisos o desaparecida: se omite como os.walk
+            pass
+        
+        return subcarpetas
+    
+    def _recorrer_carpeta(self, carpeta: str, generacion: int,
+                          avisar_avance) -> Optional[IndiceArchivos]:
+        """
+        Recorre una carpeta completa en un hilo de pool_indexado.
+        
+        Args:
+            carpeta: Carpeta de la raíz a recorrer
+            generacion: Generación de indexado que pidió el recorrido
+            avisar_avance: Función de _crear_aviso_avance, o None para no avisar
+            
+        Returns:
+            Índice sin finalizar con los archivos de la carpeta, o None si
+            la indexación fue cancelada
+        """
+        indice = IndiceArchivos()
+        enviados = 0
+        
+        # Recorrido iterativo: sin recursión ni límite de profundidad
+        pendientes = [carpeta]
+        while pendientes:
+            if generacion != self.generacion_indexado:
+                return None
+            
+            pendientes.extend(self._listar_carpeta(pendientes.pop(), indice))
             
-            self.todos_los_archivos.sort(key=lambda x: x['nombre'].lower())
-            QTimer.singleShot(0, self.mostrar_todos_los_archivos)
+            if avisar_avance and len(indice) - enviados >= self.TAMANIO_LOTE_INDEXADO:
+                avisar_avance(indice.nombres[enviados:])
+                enviados = len(indice)
+        
+        if avisar_avance and len(indice) > enviados:
+            avisar_avance(indice.nombres[enviados:])
+        
+        return indice
+    
+    def _crear_aviso_avance(self, generacion: int, total_inicial: int):
+        """
+        Crea la función con la que los recorridos informan su avance.
+        
+        Varios hilos la llaman a la vez; el candado mantiene el total
+        acumulado y hace que los avisos salgan en orden creciente.
+        
+        Args:
+            generacion: Generación de indexado
+            total_inicial: Archivos ya enviados antes de los recorridos
+        """
+        candado = threading.Lock()
+        total = [total_inicial]
+        
+        def avisar(nombres: List[str]):
+            with candado:
+                total[0] += len(nombres)
+                self.signals.indexacion_parcial.emit(generacion, total[0], nombres)
+        
+        return avisar
+    
+    def _cargar_indice_guardado(self, archivo_indice: Optional[str]) -> Optional[IndiceArchivos]:
+        """
+        Carga el índice guardado de una unidad, si existe.
+        
+        Args:
+            archivo_indice: Resultado de ruta_indice_guardado()
+            
+        Returns:
+            El índice guardado, o None si no hay uno válido
+        """
+        if not archivo_indice or not os.path.exists(archivo_indice):
+            return None
+        
+        try:
+            return IndiceArchivos.cargar(archivo_indice)
         except Exception as e:
-            print(f"Error indexando: {e}")
+            print(f"Error cargando índice guardado: {e}")
+            return None
+    
+    def _on_indexacion_parcial(self, generacion: int, total: int, nombres: List[str]):
+        """
+        Muestra el avance de la indexación mientras recorre la unidad.
+        
+        Actualiza el contador de la línea "Indexando archivos..." y agrega
+        los nombres encontrados (sin ordenar). Al terminar, la lista se
+        reemplaza por el índice completo y ordenado.
+        """
+        try:
+            if generacion != self.generacion_indexado:
+                return
+            
+            # Las 5 primeras líneas son el encabezado de seleccionar_unidad
+            modelo = self.modelo_resultados
+            if modelo.rowCount() < 5:
+                return
+            
+            modelo.cambiar_linea(4, f"  Indexando archivos... {total} encontrados")
+            modelo.agregar_lineas([f"  {nombre}" for nombre in nombres])
+        except Exception as e:
+            print(f"Error mostrando avance de indexación: {e}")
+    
+    def _on_indexacion_completa(self, generacion: int, indice: IndiceArchivos):
+        """Publica el índice terminado si sigue siendo el de la unidad actual."""
+        try:
+            if generacion != self.generacion_indexado:
+                return
+            
+            # El índice guardado puede ser reemplazado por el recorrido
+            # actualizado; las posiciones de una búsqueda en curso ya no valen
+            consulta_contenido = self.consulta_contenido
+            self._cancelar_busqueda_contenido()
+            self.indice = indice
+            self._recordar_indice(indice)
+            
+            # La búsqueda por contenido en curso o en pantalla se repite sobre
+            # el índice nuevo, en lugar de reemplazarla por la lista completa
+            if consulta_contenido:
+                self._buscar_por_contenido_automatico(consulta_contenido)
+            # Si el usuario ya estaba buscando por nombre o extensión, se repite
+            elif (self.search_input.text().strip()
+                    and self.tipo_busqueda != self.BUSQUEDA_CONTENIDO):
+                self._ejecutar_busqueda_diferida()
+            else:
+                self.mostrar_todos_los_archivos()
+        except Exception as e:
+            print(f"Error publicando indice: {e}")
+    
+    def _recordar_indice(self, indice: IndiceArchivos):
+        """
+        Guarda el índice publicado entre los recientes (LRU).
+        
+        Solo se conservan MAX_INDICES_EN_MEMORIA unidades; se descarta
+        la usada hace más tiempo.
+        """
+        if not self.clave_indice:
+            return
+        
+        self.indices_en_memoria[self.clave_indice] = indice
+        self.indices_en_memoria.move_to_end(self.clave_indice)
+        while len(self.indices_en_memoria) > self.MAX_INDICES_EN_MEMORIA:
+            self.indices_en_memoria.popitem(last=False)
     
     def mostrar_todos_los_archivos(self):
         """Muestra todos los archivos."""
         try:
-            self.results_list.clear()
-            self.resultados = self.todos_los_archivos
+            self.generacion_nombres += 1
+            self.resultados = range(len(self.indice))
             
-            try:
-                self.results_list.itemDoubleClicked.disconnect()
-            except:
-                pass
-            self.results_list.itemDoubleClicked.connect(self.abrir_item)
-            
-            if not self.todos_los_archivos:
-                self.results_list.addItem("")
-                self.results_list.addItem("  No hay archivos")
+            if not self.resultados:
+                self._poblar_resultados(["", "  No hay archivos"])
                 return
             
-            self.results_list.addItem(f"  Total: {len(self.todos_los_archivos)} archivos")
-            self.results_list.addItem("  " + "_" * 80)
-            
-            for archivo in self.todos_los_archivos[:self.MAX_ARCHIVOS_MOSTRADOS]:
-                self.results_list.addItem(f"  {archivo['nombre']}")
+            encabezado = [
+                f"  Total: {len(self.resultados)} archivos",
+                "  " + "_" * 80
+            ]
             
-            restantes = len(self.todos_los_archivos) - self.MAX_ARCHIVOS_MOSTRADOS
-            if restantes > 0:
-                self.results_list.addItem("")
-                self.results_list.addItem(f"  ... y {restantes} archivos más")
+            self._poblar_resultados(encabezado, self.resultados)
         except Exception as e:
             print(f"Error mostrando archivos: {e}")
     
+    def _poblar_resultados(self, encabezado: List[str], indices: Sequence[int] = (),
+                           prefijo: str = "  ", pie: Sequence[str] = ()):
+        """
+        Reemplaza el contenido de la lista de resultados.
+        
+        Solo se reemplazan las referencias del modelo; los nombres se
+        leen de self.indice cuando la vista pinta cada fila.
+        
+        Args:
+            encabezado: Líneas de texto antes de los archivos
+            indices: Posiciones en self.indice de los archivos a mostrar
+            prefijo: Texto antepuesto al nombre de cada archivo
+            pie: Líneas de texto después de los archivos
+        """
+        self.consulta_mostrada = None
+        self.consulta_contenido = None
+        self.modelo_resultados.establecer(
+            encabezado, self.indice.nombres, indices, prefijo, pie
+        )
+    
     # ========== BÚSQUEDA ==========
     
     def cambiar_tipo_busqueda(self, boton):
@@ -430,16 +901,60 @@ class BuscadorArchivos(VentanaBase):
                 self._buscar_por_contenido_automatico(texto)
                 return
             
+            # Sin índice todavía: al terminar de indexar se repite la búsqueda
+            if not len(self.indice):
+                return
+            
+            # El texto volvió a lo que ya se muestra (ej: tecla y retroceso)
             texto_lower = texto.lower()
+            if self.consulta_mostrada == (texto_lower, self.indice):
+                return
             
-            if self.tipo_busqueda == self.BUSQUEDA_EXTENSION:
-                coincidencias = self._buscar_por_extension(texto_lower)
+            self.generacion_nombres += 1
+            self.pool_nombres.submit(
+                self._buscar_nombres_thread,
+                texto_lower, self.tipo_busqueda, self.indice,
+                self.generacion_nombres
+            )
+        except Exception as e:
+            print(f"Error en búsqueda: {e}")
+    
+    def _buscar_nombres_thread(self, texto: str, tipo: int,
+                               indice: IndiceArchivos, generacion: int):
+        """
+        Busca por nombre o extensión fuera del hilo de la interfaz.
+        
+        Args:
+            texto: Texto a buscar, en minúsculas
+            tipo: BUSQUEDA_NOMBRE o BUSQUEDA_EXTENSION
+            indice: Índice sobre el que se busca
+            generacion: Generación de la búsqueda al encolarla
+        """
+        try:
+            # Ya llegó otra tecla mientras esta búsqueda esperaba en cola
+            if generacion != self.generacion_nombres:
+                return
+            
+            if tipo == self.BUSQUEDA_EXTENSION:
+                coincidencias = indice.buscar_por_extension(texto)
             else:
-                coincidencias = self._buscar_por_nombre(texto_lower)
+                coincidencias = indice.buscar_por_nombre(texto)
             
-            self._mostrar_resultados(coincidencias, texto_lower)
+            self.signals.resultados_nombre.emit(generacion, indice, coincidencias, texto)
         except Exception as e:
-            print(f"Error en búsqueda: {e}")
+            print(f"Error en búsqueda por nombre: {e}")
+    
+    def _on_resultados_nombre(self, generacion: int, indice: IndiceArchivos,
+                              coincidencias: list, texto: str):
+        """Muestra los resultados si siguen correspondiendo al texto y a la unidad."""
+        try:
+            if generacion != self.generacion_nombres or indice is not self.indice:
+                return
+            
+            self._mostrar_resultados(coincidencias, texto)
+            self.consulta_mostrada = (texto, indice)
+        except Exception as e:
+            print(f"Error mostrando búsqueda: {e}")
     
     def buscar_sugerencias(self):
         """Compatibilidad."""
@@ -448,38 +963,6 @@ class BuscadorArchivos(VentanaBase):
         except:
             pass
     
-    def _buscar_por_nombre(self, texto: str) -> List[Dict]:
-        """Busca por nombre."""
-        try:
-            coincidencias = []
-            for archivo in self.todos_los_archivos:
-                try:
-                    nombre = os.path.splitext(archivo['nombre'])[0].lower()
-                    if texto in nombre:
-                        coincidencias.append(archivo)
-                except:
-                    continue
-            return coincidencias
-        except:
-            return []
-    
-    def _buscar_por_extension(self, texto: str) -> List[Dict]:
-        """Busca por extensión."""
-        try:
-            if not texto.startswith('.'):
-                texto = '.' + texto
-            
-            coincidencias = []
-            for archivo in self.todos_los_archivos:
-                try:
-                    if archivo['extension'] == texto:
-                        coincidencias.append(archivo)
-                except:
-                    continue
-            return coincidencias
-        except:
-            return []
-        
 
     def _buscar_por_contenido_automatico(self, texto: str) -> None:
         """
@@ -498,7 +981,7 @@ class BuscadorArchivos(VentanaBase):
                 self.alerta("Selecciona una unidad USB primero")
                 return
             
-            if not self.todos_los_archivos:
+            if not len(self.indice):
                 self.alerta("No hay archivos indexados")
                 return
             
@@ -507,6 +990,10 @@ class BuscadorArchivos(VentanaBase):
             
             # Iniciar búsqueda
             self.buscando_contenido = True
+            self.generacion_contenido += 1
+            
+            if self.pool_documentos is None:
+                self.pool_documentos = self._crear_pool_documentos()
             
             # Agregar al historial
             self.historial.agregar(texto)
@@ -516,19 +1003,22 @@ class BuscadorArchivos(VentanaBase):
             self.btn_buscar.setEnabled(False)
             self.search_input.setEnabled(False)
             
-            # Mostrar mensaje de búsqueda en progreso
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem("   BUSCANDO EN CONTENIDO...")
-            self.results_list.addItem("")
-            self.results_list.addItem("   Por favor espera...")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Progreso: 0%")
+            # Mostrar mensaje de búsqueda en progreso; las coincidencias
+            # parciales se agregan debajo como filas de archivo
+            self._poblar_resultados([
+                "",
+                "   BUSCANDO EN CONTENIDO...",
+                "",
+                "   Por favor espera...",
+                "",
+                "  Progreso: 0%"
+            ], prefijo="  📄 ")
+            self.consulta_contenido = texto
             
             # Ejecutar búsqueda en thread separado
             threading.Thread(
                 target=self._ejecutar_busqueda_contenido_thread, 
-                args=(texto_busqueda,), 
+                args=(texto_busqueda, self.indice, self.generacion_contenido), 
                 daemon=True
             ).start()
             
@@ -536,77 +1026,165 @@ class BuscadorArchivos(VentanaBase):
             print(f"Error iniciando búsqueda por contenido: {e}")
             self.buscando_contenido = False
     
-    def _mostrar_resultados(self, coincidencias: List[Dict], texto: str):
+    def _mostrar_resultados(self, coincidencias: List[int], texto: str):
         """Muestra resultados."""
         try:
-            self.results_list.clear()
             self.resultados = coincidencias
             
-            try:
-                self.results_list.itemDoubleClicked.disconnect()
-            except:
-                pass
-            self.results_list.itemDoubleClicked.connect(self.abrir_item)
-            
             tipo_str = "extensión" if self.tipo_busqueda == self.BUSQUEDA_EXTENSION else "nombre"
             
-            self.results_list.addItem(f"  Búsqueda por {tipo_str}: '{texto}'")
-            self.results_list.addItem(f"  Resultados: {len(coincidencias)} archivo(s)")
-            self.results_list.addItem("  " + "_" * 80)
+            encabezado = [
+                f"  Búsqueda por {tipo_str}: '{texto}'",
+                f"  Resultados: {len(coincidencias)} archivo(s)",
+                "  " + "_" * 80
+            ]
             
             if not coincidencias:
-                self.results_list.addItem("")
-                self.results_list.addItem("Error al encontrar arvhivo")
-                self.results_list.addItem("")
-                self.results_list.addItem("Verifique su busqueda")
+                self._poblar_resultados(encabezado + [
+                    "",
+                    "Error al encontrar arvhivo",
+                    "",
+                    "Verifique su busqueda"
+                ])
                 return
             
-            for archivo in coincidencias[:self.MAX_ARCHIVOS_MOSTRADOS]:
-                self.results_list.addItem(f"  {archivo['nombre']}")
-            
-            if len(coincidencias) > self.MAX_ARCHIVOS_MOSTRADOS:
-                restantes = len(coincidencias) - self.MAX_ARCHIVOS_MOSTRADOS
-                self.results_list.addItem("")
-                self.results_list.addItem(f"  ... y {restantes} más")
+            self._poblar_resultados(encabezado, coincidencias)
         except Exception as e:
             print(f"Error mostrando resultados: {e}")
     
     
-    def _ejecutar_busqueda_contenido_thread(self, texto: str):
-        """Thread de búsqueda."""
+    def _ejecutar_busqueda_contenido_thread(self, texto: str, indice: IndiceArchivos,
+                                            generacion: int):
+        """
+        Thread de búsqueda.
+        
+        Reparte los archivos en self.pool_contenido con buscar_en_paralelo()
+        (solo MAX_ARCHIVOS_EN_VUELO enviados a la vez). Los documentos que
+        no están en el caché se parsean en self.pool_documentos (otros
+        procesos). El hilo trabaja solo sobre el índice recibido y no toca
+        la interfaz. Las coincidencias se envían a la interfaz junto con
+        el progreso, para mostrarlas antes de terminar.
+        
+        Args:
+            texto: Texto a buscar
+            indice: Índice vigente al iniciar la búsqueda
+            generacion: Generación de búsqueda asignada a este hilo
+        """
         try:
+            # Sin el caché de la sesión anterior se parsearía todo de nuevo
+            self.cache_contenido_cargado.wait()
+            
             texto_lower = texto.lower()
             coincidencias = []
-            total = len(self.todos_los_archivos)
-            
-            for idx, archivo in enumerate(self.todos_los_archivos):
-                try:
-                    if idx % 5 == 0:
-                        progreso = int((idx / total) * 100)
-                        self.signals.progreso_actualizado.emit(idx, total, progreso)
-                    
-                    contenido = leer_contenido_archivo(archivo['ruta'])
+            nuevas = []
+            
+            # Solo se leen las extensiones que algún lector sabe extraer;
+            # fotos, videos y ejecutables se descartan sin abrirlos. El tamaño
+            # guardado al indexar descarta los archivos grandes sin un stat
+            tamanios = indice.tamanios
+            candidatos = [
+                idx
+                for extension, posiciones in indice.por_extension.items()
+                if LectorFactory.tiene_lector(extension)
+                for idx in posiciones
+                if tamanios[idx] <= MAX_TAMANIO_CONTENIDO
+            ]
+            # Los archivos chicos primero: aparecen coincidencias y avanza el
+            # progreso antes de llegar a los grandes
+            candidatos.sort(key=tamanios.__getitem__)
+            total = len(candidatos)
+            
+            hechos = 0
+            ultimo_aviso = 0
+            
+            for terminados, encontrados in buscar_en_paralelo(
+                self.pool_contenido, indice, candidatos, texto_lower,
+                self._extraer_en_proceso
+            ):
+                if generacion != self.generacion_contenido:
+                    return
+                
+                coincidencias.extend(encontrados)
+                nuevas.extend(encontrados)
+                
+                hechos += terminados
+                if hechos - ultimo_aviso >= 5:
+                    ultimo_aviso = hechos
+                    progreso = int((hechos / total) * 100)
+                    self.signals.progreso_actualizado.emit(hechos, total, progreso)
                     
-                    if texto_lower in contenido:
-                        coincidencias.append(archivo)
-                except:
-                    continue
-            
-            self.signals.busqueda_finalizada.emit(coincidencias, texto)
+                    if nuevas:
+                        self.signals.coincidencias_parciales.emit(generacion, nuevas)
+                        nuevas = []
+            
+            # Los archivos terminan en cualquier orden; se restaura el alfabético
+            coincidencias.sort()
+            if generacion == self.generacion_contenido:
+                self.signals.busqueda_finalizada.emit(indice, coincidencias, texto)
         except Exception as e:
-            self.signals.error_busqueda.emit(str(e))
+            if generacion == self.generacion_contenido:
+                self.signals.error_busqueda.emit(str(e))
+    
+    def _extraer_en_proceso(self, ruta: str) -> str:
+        """
+        Extrae un documento en pool_documentos y espera el resultado.
+        
+        Se llama desde los hilos de pool_contenido, que quedan bloqueados
+        sin retener el GIL mientras otro proceso hace el parseo.
+        """
+        pool = self.pool_documentos
+        try:
+            return pool.submit(extraer_contenido, ruta).result()
+        except BrokenProcessPool:
+            # Un parser tiró su proceso y el pool ya no acepta trabajos: se
+            # reemplaza una sola vez aunque varios hilos lo noten a la vez. El
+            # archivo cuenta como no legible y, sin caché, se reintenta luego
+            with self.candado_documentos:
+                if self.pool_documentos is pool:
+                    self.pool_documentos = self._crear_pool_documentos()
+                    pool.shutdown(wait=False)
+            raise
+    
+    def _crear_pool_documentos(self) -> ProcessPoolExecutor:
+        """Crea el pool de procesos que parsea los documentos."""
+        return ProcessPoolExecutor(max_workers=self.MAX_PROCESOS_DOCUMENTOS)
+    
+    def _cancelar_busqueda_contenido(self):
+        """Abandona la búsqueda por contenido en curso y reactiva los controles."""
+        self.generacion_contenido += 1
+        
+        if self.buscando_contenido:
+            self.buscando_contenido = False
+            self.btn_buscar.setEnabled(True)
+            self.search_input.setEnabled(True)
     
     def _on_progreso_actualizado(self, actual: int, total: int, porcentaje: int):
         """Actualiza progreso."""
         try:
-            if self.results_list.count() >= 6:
-                item = self.results_list.item(5)
-                if item:
-                    item.setText(f"  Progreso: {actual}/{total} ({porcentaje}%)")
+            self.modelo_resultados.cambiar_linea(
+                5, f"  Progreso: {actual}/{total} ({porcentaje}%)"
+            )
         except:
             pass
     
-    def _on_busqueda_finalizada(self, coincidencias: List[Dict], texto: str):
+    def _on_coincidencias_parciales(self, generacion: int, indices: List[int]):
+        """
+        Agrega las coincidencias encontradas mientras la búsqueda sigue.
+        
+        Se agregan debajo del progreso, en el orden en que aparecen, como
+        filas de archivo que ya se pueden abrir con doble clic; al terminar,
+        la lista se reemplaza por los resultados ordenados.
+        """
+        try:
+            if generacion != self.generacion_contenido or not self.buscando_contenido:
+                return
+            
+            self.modelo_resultados.agregar_archivos(indices)
+        except Exception as e:
+            print(f"Error mostrando coincidencias parciales: {e}")
+    
+    def _on_busqueda_finalizada(self, indice: IndiceArchivos,
+                                coincidencias: List[int], texto: str):
         """Finaliza búsqueda."""
         try:
             self.buscando_contenido = False
@@ -615,7 +1193,14 @@ class BuscadorArchivos(VentanaBase):
             self.btn_buscar.setEnabled(True)
             self.search_input.setEnabled(True)
             
+            # Las posiciones solo valen para el índice sobre el que se buscó
+            if indice is not self.indice:
+                return
+            
+            # Los resultados en pantalla siguen siendo de esta búsqueda
+            consulta = self.consulta_contenido
             self._mostrar_resultados_contenido(coincidencias, texto)
+            self.consulta_contenido = consulta
         except:
             pass
     
@@ -628,45 +1213,32 @@ class BuscadorArchivos(VentanaBase):
             self.btn_buscar.setEnabled(True)
             self.search_input.setEnabled(True)
             
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem(f" Error: {error}")
+            self._poblar_resultados(["", f" Error: {error}"])
         except:
             pass
     
-    def _mostrar_resultados_contenido(self, coincidencias: List[Dict], texto: str):
+    def _mostrar_resultados_contenido(self, coincidencias: List[int], texto: str):
         """Muestra resultados de contenido."""
         try:
-            self.results_list.clear()
             self.resultados = coincidencias
             
-            try:
-                self.results_list.itemDoubleClicked.disconnect()
-            except:
-                pass
-            self.results_list.itemDoubleClicked.connect(self.abrir_item)
-            
-            self.results_list.addItem(f"Búsqueda por CONTENIDO: '{texto}'")
-            self.results_list.addItem(f"Resultados: {len(coincidencias)} archivo(s)")
-            self.results_list.addItem("  " + "_" * 80)
+            encabezado = [
+                f"Búsqueda por CONTENIDO: '{texto}'",
+                f"Resultados: {len(coincidencias)} archivo(s)",
+                "  " + "_" * 80
+            ]
             
             if not coincidencias:
-                self.results_list.addItem("")
-
-                self.results_list.addItem("No se encontraron archivos")
-                self.results_list.addItem("")
-                self.results_list.addItem(" • Verifica la ortografía")
-                self.results_list.addItem(" • Intenta palabras más simples")
+                self._poblar_resultados(encabezado + [
+                    "",
+                    "No se encontraron archivos",
+                    "",
+                    " • Verifica la ortografía",
+                    " • Intenta palabras más simples"
+                ])
                 return
             
-            self.results_list.addItem("")
-            for archivo in coincidencias[:self.MAX_ARCHIVOS_MOSTRADOS]:
-                self.results_list.addItem(f"  📄 {archivo['nombre']}")
-            
-            if len(coincidencias) > self.MAX_ARCHIVOS_MOSTRADOS:
-                restantes = len(coincidencias) - self.MAX_ARCHIVOS_MOSTRADOS
-                self.results_list.addItem("")
-                self.results_list.addItem(f"  ... y {restantes} más")
+            self._poblar_resultados(encabezado + [""], coincidencias, "  📄 ")
         except Exception as e:
             print(f"Error mostrando resultados contenido: {e}")
     
@@ -691,28 +1263,23 @@ class BuscadorArchivos(VentanaBase):
         except Exception as e:
             print(f"Error buscando: {e}")
     
-    def abrir_item(self, item):
+    def abrir_item(self, item: QModelIndex):
         """
         Abre un archivo con la aplicación predeterminada del sistema.
         Muestra mensajes claros si hay errores.
         """
         try:
-            # Extraer nombre del archivo
-            texto = item.text().strip().replace("📄", "").strip()
-            
-            # Buscar el archivo en los resultados
-            archivo_encontrado = None
-            for archivo in self.resultados:
-                if archivo['nombre'] == texto:
-                    archivo_encontrado = archivo
-                    break
+            # Las filas de archivo guardan su posición en self.indice;
+            # los encabezados y mensajes no tienen datos asociados
+            indice = item.data(Qt.UserRole)
+            if indice is None:
+                return
             
-            # Si no se encuentra
-            if not archivo_encontrado:
+            if indice >= len(self.indice):
                 self.alerta("No se pudo localizar el archivo seleccionado.")
                 return
             
-            ruta = archivo_encontrado['ruta']
+            ruta = self.indice.rutas[indice]
             
             # Verificar que el archivo existe
             if not os.path.exists(ruta):
@@ -726,9 +1293,9 @@ class BuscadorArchivos(VentanaBase):
             
             # Intentar abrir según el sistema operativo
             try:
-                if platform.system() == 'Windows':
+                if SISTEMA == 'Windows':
                     os.startfile(ruta)
-                elif platform.system() == 'Darwin':
+                elif SISTEMA == 'Darwin':
                     resultado = subprocess.call(['open', ruta])
                     if resultado != 0:
                         raise OSError("No se pudo abrir")
@@ -774,12 +1341,13 @@ class BuscadorArchivos(VentanaBase):
     def mostrar_mensaje_inicial(self):
         """Mensaje inicial."""
         try:
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem("  Buscador de Archivos USB")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Selecciona una unidad USB...")
-            self.results_list.addItem("")
+            self._poblar_resultados([
+                "",
+                "  Buscador de Archivos USB",
+                "",
+                "  Selecciona una unidad USB...",
+                ""
+            ])
         except:
             pass
     
@@ -810,4 +1378,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # El ejecutable de PyInstaller relanza este script en cada proceso hijo
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,180 @@
+from typing import List, Optional, Sequence
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class ModeloLista(QAbstractListModel):
+    """
+    Modelo de solo lectura sobre una secuencia de textos de Python.
+    - Lee directamente de la lista original (sin copiarla a un QStringList)
+    - Puede mostrar solo un subconjunto mediante una lista de índices
+    - Actualización en O(1): solo se reemplazan las referencias
+    """
+
+    def __init__(self, parent=None):
+        """
+        Inicializa el modelo vacío.
+
+        Args:
+            parent: Objeto padre de Qt (opcional)
+        """
+        super().__init__(parent)
+        self._textos: Sequence[str] = ()
+        self._indices: Optional[Sequence[int]] = None
+
+    def establecer(self, textos: Sequence[str], indices: Optional[Sequence[int]] = None):
+        """
+        Reemplaza los datos mostrados por el modelo.
+
+        Args:
+            textos: Secuencia con todos los textos disponibles
+            indices: Posiciones de `textos` a mostrar, en orden.
+                     None = mostrar la secuencia completa
+        """
+        self.beginResetModel()
+        self._textos = textos
+        self._indices = indices
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._indices is None:
+            return len(self._textos)
+        return len(self._indices)
+
+    def data(self, index, role=Qt.DisplayRole):
+        # QCompleter consulta EditRole, las vistas DisplayRole
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+
+        fila = index.row()
+        if self._indices is not None:
+            fila = self._indices[fila]
+        return self._textos[fila]
+
+
+class ModeloResultados(QAbstractListModel):
+    """
+    Modelo de la lista de resultados (vista virtual).
+    - Líneas de texto fijas antes (encabezado) y después (pie) de los archivos
+    - Los nombres de archivo se leen del índice solo cuando la vista pinta
+      esa fila: mostrar miles de resultados no crea un item por archivo
+    - Cada fila de archivo devuelve su posición en el índice con Qt.UserRole
+    """
+
+    def __init__(self, parent=None):
+        """
+        Inicializa el modelo vacío.
+
+        Args:
+            parent: Objeto padre de Qt (opcional)
+        """
+        super().__init__(parent)
+        self._encabezado: List[str] = []
+        self._nombres: Sequence[str] = ()
+        self._indices: Sequence[int] = ()
+        # Copia propia de _indices, creada al agregar el primer archivo
+        self._indices_agregados: Optional[List[int]] = None
+        self._prefijo = ""
+        self._pie: List[str] = []
+
+    def establecer(self, encabezado: Sequence[str], nombres: Sequence[str] = (),
+                   indices: Sequence[int] = (), prefijo: str = "  ",
+                   pie: Sequence[str] = ()):
+        """
+        Reemplaza todo el contenido de la lista.
+
+        Args:
+            encabezado: Líneas de texto antes de los archivos
+            nombres: Nombres de todos los archivos del índice
+            indices: Posiciones en `nombres` de los archivos a mostrar, en orden
+            prefijo: Texto antepuesto al nombre de cada archivo
+            pie: Líneas de texto después de los archivos
+        """
+        self.beginResetModel()
+        self._encabezado = list(encabezado)
+        self._nombres = nombres
+        self._indices = indices
+        self._indices_agregados = None
+        self._prefijo = prefijo
+        self._pie = list(pie)
+        self.endResetModel()
+
+    def cambiar_linea(self, fila: int, texto: str):
+        """
+        Reemplaza una línea del encabezado (por ejemplo, un contador de progreso).
+
+        Args:
+            fila: Número de línea del encabezado; si no existe no hace nada
+            texto: Nuevo texto de la línea
+        """
+        if fila >= len(self._encabezado):
+            return
+
+        self._encabezado[fila] = texto
+        indice = self.index(fila)
+        self.dataChanged.emit(indice, indice)
+
+    def agregar_archivos(self, indices: Sequence[int]):
+        """
+        Agrega archivos después de los ya mostrados (antes del pie).
+
+        La secuencia recibida en establecer() no se modifica: se copia una
+        sola vez, al primer agregado, y las siguientes tandas extienden
+        esa copia.
+
+        Args:
+            indices: Posiciones en `nombres` de los archivos a agregar
+        """
+        if not indices:
+            return
+
+        inicio = len(self._encabezado) + len(self._indices)
+        self.beginInsertRows(QModelIndex(), inicio, inicio + len(indices) - 1)
+        if self._indices_agregados is None:
+            self._indices_agregados = list(self._indices)
+            self._indices = self._indices_agregados
+        self._indices_agregados.extend(indices)
+        self.endInsertRows()
+
+    def agregar_lineas(self, lineas: Sequence[str]):
+        """
+        Agrega líneas de texto al final de la lista.
+
+        Args:
+            lineas: Líneas a agregar
+        """
+        if not lineas:
+            return
+
+        inicio = self.rowCount()
+        self.beginInsertRows(QModelIndex(), inicio, inicio + len(lineas) - 1)
+        self._pie.extend(lineas)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._encabezado) + len(self._indices) + len(self._pie)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.UserRole):
+            return None
+
+        fila = index.row()
+        posicion = None
+
+        if fila < len(self._encabezado):
+            texto = self._encabezado[fila]
+        else:
+            fila -= len(self._encabezado)
+            if fila < len(self._indices):
+                posicion = self._indices[fila]
+                texto = self._prefijo + self._nombres[posicion]
+            else:
+                texto = self._pie[fila - len(self._indices)]
+
+        if role == Qt.UserRole:
+            return posicion
+        return texto
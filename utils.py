@@ -1,24 +1,29 @@
 import os
 import sys
+import ctypes.wintypes
 import string
 import threading
 import subprocess
 import platform
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Sequence
 import win32file
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QListWidget, QLabel, QMessageBox, 
+    QPushButton, QLineEdit, QLabel, QMessageBox, 
     QFrame, QCompleter, QTextEdit
 )
-from PyQt5.QtCore import Qt, QTimer, QStringListModel, pyqtSignal, QObject
+from PyQt5.QtCore import Qt, QTimer, QModelIndex, QStringListModel, pyqtSignal, QObject
 from PyQt5.QtGui import QFont
 
 from ventana import VentanaBase
 from GestorHistorial import GestorHistorial
+from IndiceArchivos import IndiceArchivos
 from ventana_instrucciones import VentanaInstrucciones
 from lectores import leer_contenido_archivo as leer_contenido_archivo_factory
+from lectores import buscar_en_paralelo, LectorFactory
+from lectores import MAX_TAMANIO_CONTENIDO, MAX_HILOS_CONTENIDO
 
 
 # ========== CONSTANTES ==========
@@ -30,35 +35,55 @@ EXTENSIONES_TEXTO = {
 
 ENCODINGS_TEXTO = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
 
+# Sistema operativo, para elegir cómo abrir archivos (no cambia en ejecución)
+SISTEMA = platform.system()
+
+# Mensaje de Windows al conectar/desconectar dispositivos y sus eventos de interés
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+
 
 # ========== SEÑALES ==========
 
 class Signals(QObject):
     """Señales para comunicación thread-safe."""
     progreso_actualizado = pyqtSignal(int, int, int)
-    busqueda_finalizada = pyqtSignal(list, str)
+    busqueda_finalizada = pyqtSignal(object, list, str)
     error_busqueda = pyqtSignal(str)
+    indexacion_completa = pyqtSignal(int, object)
 
 
 # ========== FUNCIONES AUXILIARES ==========
 
-def detectar_unidades_disponibles() -> List[Dict[str, str]]:
-    """Detecta unidades extraíbles USB."""
+def detectar_unidades_disponibles(mascara: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    Detecta unidades extraíbles USB.
+    
+    Args:
+        mascara: Máscara de GetLogicalDrives (bit 0 = A:, bit 1 = B:, ...).
+                 None = consultarla aquí
+    """
     unidades = []
     
-    for letra in string.ascii_uppercase:
+    if mascara is None:
+        mascara = win32file.GetLogicalDrives()
+    
+    for posicion, letra in enumerate(string.ascii_uppercase):
+        # Letras sin unidad montada: ni siquiera se consultan
+        if not mascara & (1 << posicion):
+            continue
+        
         unidad = f"{letra}:\\"
         
         if letra in ['A', 'B', 'C']:
             continue
         
-        if not os.path.exists(unidad):
-            continue
-        
         try:
             tipo_unidad = win32file.GetDriveType(unidad)
             
-            if tipo_unidad == 2:
+            # Solo se pregunta por las candidatas (ej: lector de tarjetas sin tarjeta)
+            if tipo_unidad == 2 and os.path.exists(unidad):
                 unidades.append({
                     'texto': f"{letra}:/", 
                     'ruta': unidad
@@ -87,9 +112,9 @@ def leer_contenido_archivo(ruta: str) -> str:
 class BuscadorArchivos(VentanaBase):
     """Clase principal del buscador - Versión estable."""
     
-    INTERVALO_DETECCION_USB = 2000
+    # Respaldo hasta recibir el primer WM_DEVICECHANGE; normalmente avisa Windows
+    INTERVALO_DETECCION_USB = 10000
     DELAY_BUSQUEDA_VIVO = 500
-    MAX_ARCHIVOS_MOSTRADOS = 200
     
     BUSQUEDA_NOMBRE = 1
     BUSQUEDA_EXTENSION = 2
@@ -101,21 +126,32 @@ class BuscadorArchivos(VentanaBase):
         
         # Estado
         self.unidad_seleccionada = None
-        self.resultados = []
-        self.todos_los_archivos = []
+        # Posiciones en self.indice de los archivos mostrados
+        self.resultados: Sequence[int] = []
+        self.indice = IndiceArchivos()
         self.unidades_previas = []
+        self.mascara_unidades = 0
         self.tipo_busqueda = self.BUSQUEDA_NOMBRE
         self.buscando_contenido = False
+        # Cambia con cada búsqueda por contenido; un hilo con otra generación
+        # quedó obsoleto y abandona los archivos pendientes
+        self.generacion_contenido = 0
+        # Cada indexación recibe un número de generación; un hilo cuya
+        # generación ya no es la actual fue cancelado y descarta su trabajo
+        self.generacion_indexado = 0
         
         # Señales
         self.signals = Signals()
         self.signals.progreso_actualizado.connect(self._on_progreso_actualizado)
         self.signals.busqueda_finalizada.connect(self._on_busqueda_finalizada)
         self.signals.error_busqueda.connect(self._on_error_busqueda)
+        self.signals.indexacion_completa.connect(self._on_indexacion_completa)
         
         # Historial
         self.historial = GestorHistorial()
         self.completer = None
+        self.ventana_instrucciones = None
+        self.modelo_historial = None
         self.historial.limpiar()
         
         # Inicializar UI
@@ -138,7 +174,9 @@ class BuscadorArchivos(VentanaBase):
     def mostrar_ventana_instrucciones(self):
         """Muestra ventana de instrucciones."""
         try:
-            self.ventana_instrucciones = VentanaInstrucciones(self)
+            # Se crea una sola vez; al cerrarla solo se oculta y se vuelve a mostrar
+            if self.ventana_instrucciones is None:
+                self.ventana_instrucciones = VentanaInstrucciones(self)
             self.ventana_instrucciones.mostrar()
         except:
             pass
@@ -178,6 +216,10 @@ class BuscadorArchivos(VentanaBase):
                 }
             """)
             
+            # Modelo único: se asigna una vez y solo se actualizan sus datos
+            self.modelo_historial = QStringListModel(self.completer)
+            self.completer.setModel(self.modelo_historial)
+            
             self.search_input.setCompleter(self.completer)
             self.actualizar_completer()
         except Exception as e:
@@ -186,10 +228,8 @@ class BuscadorArchivos(VentanaBase):
     def actualizar_completer(self):
         """Actualiza completer."""
         try:
-            if self.completer:
-                model = QStringListModel()
-                model.setStringList(self.historial.obtener_todos())
-                self.completer.setModel(model)
+            if self.modelo_historial:
+                self.modelo_historial.setStringList(list(self.historial.obtener_todos()))
         except:
             pass
     
@@ -204,20 +244,13 @@ class BuscadorArchivos(VentanaBase):
             # Detectar tipo
             self._detectar_tipo_busqueda(texto)
             
-            # Actualizar historial
-            try:
-                coincidencias = self.historial.buscar_coincidencias(texto)
-                if self.completer:
-                    model = QStringListModel()
-                    model.setStringList(coincidencias)
-                    self.completer.setModel(model)
-            except:
-                pass
+            # El completer ya tiene todo el historial y lo filtra con
+            # MatchContains; no hace falta un modelo nuevo por tecla
             
             # Si vacío, mostrar todo
             if not texto.strip():
                 self.timer_autocompletar.stop()
-                if self.unidad_seleccionada and self.todos_los_archivos:
+                if self.unidad_seleccionada and len(self.indice):
                     QTimer.singleShot(50, self.mostrar_todos_los_archivos)
                 return
             
@@ -268,32 +301,53 @@ class BuscadorArchivos(VentanaBase):
             for info in unidades:
                 btn = QPushButton(info['texto'])
                 btn.setFixedHeight(60)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2B313F; 
-                        color: white;
-                        font-size: 20px;
-                        font-weight: bold;
-                        border: 2px solid #E32D64;
-                        border-radius: 15px;
-                    } 
-                    QPushButton:hover { 
-                        background-color: #4a4a4c; 
-                    }
-                    QPushButton:pressed {
-                        background-color: #E32D64;
-                    }
-                """)
+                # Estilo compartido en VentanaBase.HOJA_ESTILOS
+                btn.setObjectName("btn_unidad")
                 btn.setCursor(Qt.PointingHandCursor)
                 btn.clicked.connect(lambda _, i=info: self.seleccionar_unidad(i))
                 self.units_layout.addWidget(btn)
         except Exception as e:
             print(f"Error cargando unidades: {e}")
     
+    def nativeEvent(self, tipo_evento, mensaje):
+        """
+        Recibe los mensajes de Windows de la ventana.
+        
+        Al conectar o quitar una unidad, Windows envía WM_DEVICECHANGE a las
+        ventanas principales: la detección se hace en ese momento, sin
+        esperar al siguiente sondeo del timer. Con el primer aviso recibido
+        queda comprobado que llegan, y el timer de respaldo se detiene.
+        """
+        try:
+            if tipo_evento == b"windows_generic_MSG":
+                msg = ctypes.wintypes.MSG.from_address(int(mensaje))
+                if (msg.message == WM_DEVICECHANGE
+                        and msg.wParam in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE)):
+                    # Fuera del manejador nativo, en la próxima vuelta del event loop
+                    QTimer.singleShot(0, self.verificar_cambios_usb)
+                    
+                    # Los avisos llegan: ya no hace falta despertar cada pocos segundos
+                    if self.timer_usb.isActive():
+                        self.timer_usb.stop()
+        except Exception as e:
+            print(f"Error procesando mensaje de Windows: {e}")
+        
+        return super().nativeEvent(tipo_evento, mensaje)
+    
     def verificar_cambios_usb(self):
-        """Verifica cambios en USB."""
+        """
+        Verifica cambios en USB.
+        
+        Cada sondeo compara solo la máscara de GetLogicalDrives (una
+        llamada); la detección completa se hace únicamente si cambió.
+        """
         try:
-            actuales = detectar_unidades_disponibles()
+            mascara = win32file.GetLogicalDrives()
+            if mascara == self.mascara_unidades:
+                return
+            self.mascara_unidades = mascara
+            
+            actuales = detectar_unidades_disponibles(mascara)
             letras_actuales = {u['texto'] for u in actuales}
             letras_previas = {u['texto'] for u in self.unidades_previas}
             
@@ -307,76 +361,131 @@ class BuscadorArchivos(VentanaBase):
     # ========== INDEXACIÓN ==========
     
     def seleccionar_unidad(self, unidad: Dict[str, str]):
-        """Selecciona unidad."""
+        """Selecciona unidad y abandona cualquier búsqueda por contenido."""
         try:
             self.unidad_seleccionada = unidad['ruta']
+            self._cancelar_busqueda_contenido()
+            
+            self._poblar_resultados([
+                "",
+                f"  Unidad seleccionada: {unidad['texto']}",
+                f"  Ruta: {unidad['ruta']}",
+                "",
+                "  Indexando archivos..."
+            ])
+            
+            # El índice anterior deja de valer ya: sus posiciones no sirven
+            # para la nueva unidad
+            self.generacion_indexado += 1
+            self.indice = IndiceArchivos()
+            self.resultados = []
             
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem(f"  Unidad seleccionada: {unidad['texto']}")
-            self.results_list.addItem(f"  Ruta: {unidad['ruta']}")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Indexando archivos...")
-            
-            threading.Thread(target=self.indexar_unidad, daemon=True).start()
+            threading.Thread(
+                target=self.indexar_unidad,
+                args=(self.unidad_seleccionada, self.generacion_indexado),
+                daemon=True
+            ).start()
         except Exception as e:
             print(f"Error seleccionando unidad: {e}")
     
-    def indexar_unidad(self):
-        """Indexa archivos."""
+    def indexar_unidad(self, raiz: str, generacion: int):
+        """
+        Indexa archivos en un hilo aparte.
+        
+        El índice se arma en una variable local y se entrega al hilo de la
+        interfaz con la señal indexacion_completa; este hilo no toca
+        self.indice ni ningún widget.
+        
+        Args:
+            raiz: Ruta raíz de la unidad
+            generacion: Generación de indexado asignada a este hilo
+        """
         try:
-            self.todos_los_archivos = []
+            indice = IndiceArchivos()
+            
+            # Recorrido iterativo con os.scandir: cada DirEntry trae el nombre, la ruta,
+            # el tipo y (en Windows) tamaño y fecha, sin un stat adicional por archivo
+            pendientes = [raiz]
+            while pendientes:
+                # Otra unidad seleccionada: este recorrido ya no sirve
+                if generacion != self.generacion_indexado:
+                    return
+                
+                try:
+                    with os.scandir(pendientes.pop()) as entradas:
+                        for entrada in entradas:
+                            try:
+                                if entrada.is_dir(follow_symlinks=False):
+                                    pendientes.append(entrada.path)
+                                elif entrada.is_file(follow_symlinks=False):
+                                    nombre_archivo = entrada.name
+                                    info = entrada.stat(follow_symlinks=False)
+                                    indice.agregar(
+                                        nombre_archivo,
+                                        entrada.path,
+                                        IndiceArchivos.extension_de(nombre_archivo),
+                                        info.st_size,
+                                        info.st_mtime_ns
+                                    )
+                            except OSError:
+                                continue
+                except OSError:
+                    # Carpeta sin permisos o desaparecida: se omite como os.walk
+                    continue
             
-            if not self.unidad_seleccionada:
+            # Columnas ordenadas más índices de trigramas y de extensiones
+            indice.finalizar()
+            self.signals.indexacion_completa.emit(generacion, indice)
+        except Exception as e:
+            print(f"Error indexando: {e}")
+    
+    def _on_indexacion_completa(self, generacion: int, indice: IndiceArchivos):
+        """Publica el índice terminado si sigue siendo el de la unidad actual."""
+        try:
+            if generacion != self.generacion_indexado:
                 return
             
-            for root, dirs, files in os.walk(self.unidad_seleccionada):
-                for nombre_archivo in files:
-                    try:
-                        ruta_completa = os.path.join(root, nombre_archivo)
-                        self.todos_los_archivos.append({
-                            'nombre': nombre_archivo,
-                            'ruta': ruta_completa,
-                            'extension': os.path.splitext(nombre_archivo)[1].lower()
-                        })
-                    except:
-                        continue
-            
-            self.todos_los_archivos.sort(key=lambda x: x['nombre'].lower())
-            QTimer.singleShot(0, self.mostrar_todos_los_archivos)
+            self.indice = indice
+            self.mostrar_todos_los_archivos()
         except Exception as e:
-            print(f"Error indexando: {e}")
+            print(f"Error publicando indice: {e}")
     
     def mostrar_todos_los_archivos(self):
         """Muestra todos los archivos."""
         try:
-            self.results_list.clear()
-            self.resultados = self.todos_los_archivos
+            self.resultados = range(len(self.indice))
             
-            try:
-                self.results_list.itemDoubleClicked.disconnect()
-            except:
-                pass
-            self.results_list.itemDoubleClicked.connect(self.abrir_item)
-            
-            if not self.todos_los_archivos:
-                self.results_list.addItem("")
-                self.results_list.addItem("  No hay archivos")
+            if not self.resultados:
+                self._poblar_resultados(["", "  No hay archivos"])
                 return
             
-            self.results_list.addItem(f"  Total: {len(self.todos_los_archivos)} archivos")
-            self.results_list.addItem("  " + "_" * 80)
+            encabezado = [
+                f"  Total: {len(self.resultados)} archivos",
+                "  " + "_" * 80
+            ]
             
-            for archivo in self.todos_los_archivos[:self.MAX_ARCHIVOS_MOSTRADOS]:
-                self.results_list.addItem(f"  {archivo['nombre']}")
-            
-            restantes = len(self.todos_los_archivos) - self.MAX_ARCHIVOS_MOSTRADOS
-            if restantes > 0:
-                self.results_list.addItem("")
-                self.results_list.addItem(f"  ... y {restantes} archivos más")
+            self._poblar_resultados(encabezado, self.resultados)
         except Exception as e:
             print(f"Error mostrando archivos: {e}")
     
+    def _poblar_resultados(self, encabezado: List[str], indices: Sequence[int] = (),
+                           prefijo: str = "  ", pie: Sequence[str] = ()):
+        """
+        Reemplaza el contenido de la lista de resultados.
+        
+        Solo se reemplazan las referencias del modelo; los nombres se
+        leen de self.indice cuando la vista pinta cada fila.
+        
+        Args:
+            encabezado: Líneas de texto antes de los archivos
+            indices: Posiciones en self.indice de los archivos a mostrar
+            prefijo: Texto antepuesto al nombre de cada archivo
+            pie: Líneas de texto después de los archivos
+        """
+        self.modelo_resultados.establecer(
+            encabezado, self.indice.nombres, indices, prefijo, pie
+        )
+    
     # ========== BÚSQUEDA ==========
     
     def cambiar_tipo_busqueda(self, boton):
@@ -421,35 +530,17 @@ class BuscadorArchivos(VentanaBase):
         except:
             pass
     
-    def _buscar_por_nombre(self, texto: str) -> List[Dict]:
-        """Busca por nombre."""
+    def _buscar_por_nombre(self, texto: str) -> List[int]:
+        """Busca por nombre con el índice de trigramas."""
         try:
-            coincidencias = []
-            for archivo in self.todos_los_archivos:
-                try:
-                    nombre = os.path.splitext(archivo['nombre'])[0].lower()
-                    if texto in nombre:
-                        coincidencias.append(archivo)
-                except:
-                    continue
-            return coincidencias
+            return self.indice.buscar_por_nombre(texto)
         except:
             return []
     
-    def _buscar_por_extension(self, texto: str) -> List[Dict]:
-        """Busca por extensión."""
+    def _buscar_por_extension(self, texto: str) -> List[int]:
+        """Busca por extensión con una consulta directa al índice."""
         try:
-            if not texto.startswith('.'):
-                texto = '.' + texto
-            
-            coincidencias = []
-            for archivo in self.todos_los_archivos:
-                try:
-                    if archivo['extension'] == texto:
-                        coincidencias.append(archivo)
-                except:
-                    continue
-            return coincidencias
+            return self.indice.buscar_por_extension(texto)
         except:
             return []
         
@@ -471,7 +562,7 @@ class BuscadorArchivos(VentanaBase):
                 self.alerta("Selecciona una unidad USB primero")
                 return
             
-            if not self.todos_los_archivos:
+            if not len(self.indice):
                 self.alerta("No hay archivos indexados")
                 return
             
@@ -480,6 +571,7 @@ class BuscadorArchivos(VentanaBase):
             
             # Iniciar búsqueda
             self.buscando_contenido = True
+            self.generacion_contenido += 1
             
             # Agregar al historial
             self.historial.agregar(texto)
@@ -490,18 +582,19 @@ class BuscadorArchivos(VentanaBase):
             self.search_input.setEnabled(False)
             
             # Mostrar mensaje de búsqueda en progreso
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem("   BUSCANDO EN CONTENIDO...")
-            self.results_list.addItem("")
-            self.results_list.addItem("   Por favor espera...")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Progreso: 0%")
+            self._poblar_resultados([
+                "",
+                "   BUSCANDO EN CONTENIDO...",
+                "",
+                "   Por favor espera...",
+                "",
+                "  Progreso: 0%"
+            ])
             
             # Ejecutar búsqueda en thread separado
             threading.Thread(
                 target=self._ejecutar_busqueda_contenido_thread, 
-                args=(texto_busqueda,), 
+                args=(texto_busqueda, self.indice, self.generacion_contenido), 
                 daemon=True
             ).start()
             
@@ -509,77 +602,114 @@ class BuscadorArchivos(VentanaBase):
             print(f"Error iniciando búsqueda por contenido: {e}")
             self.buscando_contenido = False
     
-    def _mostrar_resultados(self, coincidencias: List[Dict], texto: str):
+    def _mostrar_resultados(self, coincidencias: Sequence[int], texto: str):
         """Muestra resultados."""
         try:
-            self.results_list.clear()
             self.resultados = coincidencias
             
-            try:
-                self.results_list.itemDoubleClicked.disconnect()
-            except:
-                pass
-            self.results_list.itemDoubleClicked.connect(self.abrir_item)
-            
             tipo_str = "extensión" if self.tipo_busqueda == self.BUSQUEDA_EXTENSION else "nombre"
             
-            self.results_list.addItem(f"  Búsqueda por {tipo_str}: '{texto}'")
-            self.results_list.addItem(f"  Resultados: {len(coincidencias)} archivo(s)")
-            self.results_list.addItem("  " + "_" * 80)
+            encabezado = [
+                f"  Búsqueda por {tipo_str}: '{texto}'",
+                f"  Resultados: {len(coincidencias)} archivo(s)",
+                "  " + "_" * 80
+            ]
             
             if not coincidencias:
-                self.results_list.addItem("")
-                self.results_list.addItem("Error al encontrar arvhivo")
-                self.results_list.addItem("")
-                self.results_list.addItem("Verifique su busqueda")
+                self._poblar_resultados(encabezado + [
+                    "",
+                    "Error al encontrar arvhivo",
+                    "",
+                    "Verifique su busqueda"
+                ])
                 return
             
-            for archivo in coincidencias[:self.MAX_ARCHIVOS_MOSTRADOS]:
-                self.results_list.addItem(f"  {archivo['nombre']}")
-            
-            if len(coincidencias) > self.MAX_ARCHIVOS_MOSTRADOS:
-                restantes = len(coincidencias) - self.MAX_ARCHIVOS_MOSTRADOS
-                self.results_list.addItem("")
-                self.results_list.addItem(f"  ... y {restantes} más")
+            self._poblar_resultados(encabezado, coincidencias)
         except Exception as e:
             print(f"Error mostrando resultados: {e}")
     
     
-    def _ejecutar_busqueda_contenido_thread(self, texto: str):
-        """Thread de búsqueda."""
+    def _ejecutar_busqueda_contenido_thread(self, texto: str, indice: IndiceArchivos,
+                                            generacion: int):
+        """
+        Thread de búsqueda.
+        
+        Reparte los archivos en un pool de hilos (la lectura libera el GIL)
+        y recoge los resultados a medida que terminan; con buscar_en_paralelo()
+        solo hay MAX_ARCHIVOS_EN_VUELO archivos enviados a la vez.
+        
+        Args:
+            texto: Texto a buscar
+            indice: Índice de la unidad al iniciar la búsqueda
+            generacion: Generación de búsqueda asignada a este hilo
+        """
         try:
             texto_lower = texto.lower()
             coincidencias = []
-            total = len(self.todos_los_archivos)
             
-            for idx, archivo in enumerate(self.todos_los_archivos):
-                try:
-                    if idx % 5 == 0:
-                        progreso = int((idx / total) * 100)
-                        self.signals.progreso_actualizado.emit(idx, total, progreso)
+            # Solo se leen las extensiones que algún lector sabe extraer;
+            # fotos, videos y ejecutables se descartan sin abrirlos. El tamaño
+            # guardado al indexar descarta los archivos grandes sin un stat
+            tamanios = indice.tamanios
+            candidatos = [
+                idx
+                for extension, posiciones in indice.por_extension.items()
+                if LectorFactory.tiene_lector(extension)
+                for idx in posiciones
+                if tamanios[idx] <= MAX_TAMANIO_CONTENIDO
+            ]
+            # Los archivos chicos primero: aparecen coincidencias y avanza el
+            # progreso antes de llegar a los grandes
+            candidatos.sort(key=tamanios.__getitem__)
+            total = len(candidatos)
+            
+            with ThreadPoolExecutor(max_workers=MAX_HILOS_CONTENIDO) as pool:
+                hechos = 0
+                ultimo_aviso = 0
+                
+                for terminados, encontrados in buscar_en_paralelo(
+                    pool, indice, candidatos, texto_lower
+                ):
+                    if generacion != self.generacion_contenido:
+                        return
                     
-                    contenido = leer_contenido_archivo(archivo['ruta'])
+                    coincidencias.extend(encontrados)
                     
-                    if texto_lower in contenido:
-                        coincidencias.append(archivo)
-                except:
-                    continue
-            
-            self.signals.busqueda_finalizada.emit(coincidencias, texto)
+                    hechos += terminados
+                    if hechos - ultimo_aviso >= 5:
+                        ultimo_aviso = hechos
+                        progreso = int((hechos / total) * 100)
+                        self.signals.progreso_actualizado.emit(hechos, total, progreso)
+            
+            # Los archivos terminan en cualquier orden; las posiciones
+            # del índice ordenadas restauran el orden alfabético
+            coincidencias.sort()
+            if generacion == self.generacion_contenido:
+                self.signals.busqueda_finalizada.emit(indice, coincidencias, texto)
         except Exception as e:
-            self.signals.error_busqueda.emit(str(e))
+            if generacion == self.generacion_contenido:
+                self.signals.error_busqueda.emit(str(e))
+    
+    def _cancelar_busqueda_contenido(self):
+        """Abandona la búsqueda por contenido en curso y reactiva los controles."""
+        self.generacion_contenido += 1
+        
+        if self.buscando_contenido:
+            self.buscando_contenido = False
+            self.btn_buscar.setEnabled(True)
+            self.search_input.setEnabled(True)
     
     def _on_progreso_actualizado(self, actual: int, total: int, porcentaje: int):
         """Actualiza progreso."""
         try:
-            if self.results_list.count() >= 6:
-                item = self.results_list.item(5)
-                if item:
-                    item.setText(f"  Progreso: {actual}/{total} ({porcentaje}%)")
+            self.modelo_resultados.cambiar_linea(
+                5, f"  Progreso: {actual}/{total} ({porcentaje}%)"
+            )
         except:
             pass
     
-    def _on_busqueda_finalizada(self, coincidencias: List[Dict], texto: str):
+    def _on_busqueda_finalizada(self, indice: IndiceArchivos,
+                                coincidencias: List[int], texto: str):
         """Finaliza búsqueda."""
         try:
             self.buscando_contenido = False
@@ -588,6 +718,10 @@ class BuscadorArchivos(VentanaBase):
             self.btn_buscar.setEnabled(True)
             self.search_input.setEnabled(True)
             
+            # Las posiciones solo valen para el índice sobre el que se buscó
+            if indice is not self.indice:
+                return
+            
             self._mostrar_resultados_contenido(coincidencias, texto)
         except:
             pass
@@ -601,45 +735,32 @@ class BuscadorArchivos(VentanaBase):
             self.btn_buscar.setEnabled(True)
             self.search_input.setEnabled(True)
             
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem(f"  ❌ Error: {error}")
+            self._poblar_resultados(["", f"  ❌ Error: {error}"])
         except:
             pass
     
-    def _mostrar_resultados_contenido(self, coincidencias: List[Dict], texto: str):
+    def _mostrar_resultados_contenido(self, coincidencias: Sequence[int], texto: str):
         """Muestra resultados de contenido."""
         try:
-            self.results_list.clear()
             self.resultados = coincidencias
             
-            try:
-                self.results_list.itemDoubleClicked.disconnect()
-            except:
-                pass
-            self.results_list.itemDoubleClicked.connect(self.abrir_item)
-            
-            self.results_list.addItem(f"Búsqueda por CONTENIDO: '{texto}'")
-            self.results_list.addItem(f"Resultados: {len(coincidencias)} archivo(s)")
-            self.results_list.addItem("  " + "_" * 80)
+            encabezado = [
+                f"Búsqueda por CONTENIDO: '{texto}'",
+                f"Resultados: {len(coincidencias)} archivo(s)",
+                "  " + "_" * 80
+            ]
             
             if not coincidencias:
-                self.results_list.addItem("")
-
-                self.results_list.addItem("No se encontraron archivos")
-                self.results_list.addItem("")
-                self.results_list.addItem(" • Verifica la ortografía")
-                self.results_list.addItem(" • Intenta palabras más simples")
+                self._poblar_resultados(encabezado + [
+                    "",
+                    "No se encontraron archivos",
+                    "",
+                    " • Verifica la ortografía",
+                    " • Intenta palabras más simples"
+                ])
                 return
             
-            self.results_list.addItem("")
-            for archivo in coincidencias[:self.MAX_ARCHIVOS_MOSTRADOS]:
-                self.results_list.addItem(f"  📄 {archivo['nombre']}")
-            
-            if len(coincidencias) > self.MAX_ARCHIVOS_MOSTRADOS:
-                restantes = len(coincidencias) - self.MAX_ARCHIVOS_MOSTRADOS
-                self.results_list.addItem("")
-                self.results_list.addItem(f"  ... y {restantes} más")
+            self._poblar_resultados(encabezado + [""], coincidencias, "  📄 ")
         except Exception as e:
             print(f"Error mostrando resultados contenido: {e}")
     
@@ -664,28 +785,23 @@ class BuscadorArchivos(VentanaBase):
         except Exception as e:
             print(f"Error buscando: {e}")
     
-    def abrir_item(self, item):
+    def abrir_item(self, item: QModelIndex):
         """
         Abre un archivo con la aplicación predeterminada del sistema.
         Muestra mensajes claros si hay errores.
         """
         try:
-            # Extraer nombre del archivo
-            texto = item.text().strip().replace("📄", "").strip()
-            
-            # Buscar el archivo en los resultados
-            archivo_encontrado = None
-            for archivo in self.resultados:
-                if archivo['nombre'] == texto:
-                    archivo_encontrado = archivo
-                    break
-            
-            # Si no se encuentra
-            if not archivo_encontrado:
+            # Las filas de archivo guardan su posición en self.indice;
+            # los encabezados y mensajes no tienen datos asociados
+            indice = item.data(Qt.UserRole)
+            if indice is None:
+                return
+            
+            if indice >= len(self.indice):
                 self.alerta("No se pudo localizar el archivo seleccionado.")
                 return
             
-            ruta = archivo_encontrado['ruta']
+            ruta = self.indice.rutas[indice]
             
             # Verificar que el archivo existe
             if not os.path.exists(ruta):
@@ -699,9 +815,9 @@ class BuscadorArchivos(VentanaBase):
             
             # Intentar abrir según el sistema operativo
             try:
-                if platform.system() == 'Windows':
+                if SISTEMA == 'Windows':
                     os.startfile(ruta)
-                elif platform.system() == 'Darwin':
+                elif SISTEMA == 'Darwin':
                     resultado = subprocess.call(['open', ruta])
                     if resultado != 0:
                         raise OSError("No se pudo abrir")
@@ -747,12 +863,13 @@ class BuscadorArchivos(VentanaBase):
     def mostrar_mensaje_inicial(self):
         """Mensaje inicial."""
         try:
-            self.results_list.clear()
-            self.results_list.addItem("")
-            self.results_list.addItem("  🔍 Buscador de Archivos USB")
-            self.results_list.addItem("")
-            self.results_list.addItem("  Selecciona una unidad USB...")
-            self.results_list.addItem("")
+            self._poblar_resultados([
+                "",
+                "  🔍 Buscador de Archivos USB",
+                "",
+                "  Selecciona una unidad USB...",
+                ""
+            ])
         except:
             pass
     
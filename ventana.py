@@ -1,9 +1,11 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QListWidget, QLabel, QFrame
+    QPushButton, QLineEdit, QListView, QLabel, QFrame
 )
 from PyQt5.QtCore import Qt
 
+from modelos import ModeloResultados
+
 
 class VentanaBase(QMainWindow):
     """
@@ -18,6 +20,8 @@ class VentanaBase(QMainWindow):
     VENTANA_ANCHO = 1100
     VENTANA_ALTO = 700
     PANEL_USB_ANCHO = 260
+    # Filas que la lista de resultados dispone por tanda (QListView.Batched)
+    TANDA_DISPOSICION = 256
     
     # Paleta de colores
     COLOR_PRIMARIO = "#E32D64"      # Rosa principal
@@ -27,6 +31,112 @@ class VentanaBase(QMainWindow):
     COLOR_FONDO_CLARO = "#3a3a3c"   # Fondo claro
     COLOR_SECUNDARIO = "#4A90E2"    # Azul para botón secundario
     
+    # Estilos de todos los componentes, armados una vez al definir la clase.
+    # Cada regla se aplica por nombre de objeto (#nombre), así no alcanza
+    # a los widgets que agregan las clases derivadas
+    HOJA_ESTILOS = f"""
+        /* Fondo (oscuro arriba, más claro abajo) */
+        QMainWindow {{
+            background-color: qlineargradient(
+                x1: 0, y1: 0, x2: 0, y2: 1,
+                stop: 0 #161239,
+                stop: 1 {COLOR_FONDO_OSCURO}
+            );
+            color: white;
+        }}
+        
+        /* Campo de búsqueda */
+        QLineEdit#campo_busqueda {{
+            background-color: {COLOR_FONDO_OSCURO};
+            color: white;
+            padding: 12px 20px;
+            border: 2px solid {COLOR_PRIMARIO};
+            border-radius: 25px;
+            font-size: 18px;
+        }}
+        QLineEdit#campo_busqueda:focus {{
+            border: 2px solid {COLOR_PRIMARIO_HOVER};
+            background-color: #353B4F;
+        }}
+        
+        /* Botón buscar */
+        QPushButton#btn_buscar {{
+            background-color: {COLOR_PRIMARIO};
+            color: white;
+            font-size: 16px;
+            font-weight: bold;
+            border: none;
+            border-radius: 25px;
+        }}
+        QPushButton#btn_buscar:hover {{
+            background-color: {COLOR_PRIMARIO_HOVER};
+        }}
+        QPushButton#btn_buscar:pressed {{
+            background-color: {COLOR_PRIMARIO_PRESSED};
+        }}
+        
+        /* Panel izquierdo (y los marcos dentro de él) */
+        QFrame#panel_unidades, #panel_unidades QFrame {{
+            background-color: rgba(227, 45, 100, 0.3);
+            border: 2px solid {COLOR_PRIMARIO};
+            border-radius: 20px;
+        }}
+        QLabel#titulo_unidades {{
+            color: white;
+            font-size: 16px;
+            font-weight: bold;
+            padding: 10px;
+            background-color: rgba(0, 0, 0, 0.3);
+            border-radius: 10px;
+        }}
+        
+        /* Botones de unidades (los agregan las clases derivadas) */
+        QPushButton#btn_unidad {{
+            background-color: {COLOR_FONDO_OSCURO};
+            color: white;
+            font-size: 20px;
+            font-weight: bold;
+            border: 2px solid {COLOR_PRIMARIO};
+            border-radius: 15px;
+        }}
+        QPushButton#btn_unidad:hover {{
+            background-color: #4a4a4c;
+        }}
+        QPushButton#btn_unidad:pressed {{
+            background-color: {COLOR_PRIMARIO};
+        }}
+        
+        /* Panel derecho (y los marcos dentro de él) */
+        QFrame#panel_resultados, #panel_resultados QFrame {{
+            background-color: rgba(43, 49, 63, 0.8);
+            border: 2px solid {COLOR_PRIMARIO};
+            border-radius: 20px;
+        }}
+        
+        /* Lista de resultados */
+        QListView#lista_resultados {{
+            background-color: transparent;
+            color: white;
+            font-family: 'Segoe UI', Arial;
+            font-size: 20px;
+            font-weight: bold;
+            border: none;
+            outline: none;
+        }}
+        QListView#lista_resultados::item {{
+            padding: 8px;
+            border-radius: 5px;
+            margin: 2px;
+        }}
+        QListView#lista_resultados::item:selected {{
+            background-color: {COLOR_PRIMARIO};
+            color: white;
+        }}
+        QListView#lista_resultados::item:hover {{
+            background-color: rgba(227, 45, 100, 0.3);
+        }}
+    """
+    
     def init_ui(self):
         """
         Inicializa y configura todos los elementos de la interfaz gráfica.
@@ -56,24 +166,16 @@ class VentanaBase(QMainWindow):
         self._crear_panel_derecho(paneles)
         layout.addLayout(paneles)
         
+        # Una sola hoja de estilos para toda la ventana: Qt la interpreta
+        # una vez y la aplica a los widgets en una sola pasada
+        self.setStyleSheet(self.HOJA_ESTILOS)
+        
         self.mostrar_mensaje_inicial()
     
     def _configurar_ventana_principal(self):
         """Configura las propiedades básicas de la ventana principal."""
         self.setWindowTitle("Buscador de Archivos USB")
         self.setGeometry(100, 100, self.VENTANA_ANCHO, self.VENTANA_ALTO)
-        
-        # Fondo (oscuro arriba, más claro abajo)
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: qlineargradient(
-                    x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #161239,
-                    stop: 1 {self.COLOR_FONDO_OSCURO}
-                );
-                color: white;
-            }}
-        """)
     
     def _crear_barra_busqueda(self) -> QHBoxLayout:
         """
@@ -109,20 +211,7 @@ class VentanaBase(QMainWindow):
         """
         campo = QLineEdit()
         campo.setPlaceholderText("Escribe el nombre del archivo, @texto para buscar en contenido o .'archivo'")
-        campo.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {self.COLOR_FONDO_OSCURO};
-                color: white;
-                padding: 12px 20px;
-                border: 2px solid {self.COLOR_PRIMARIO};
-                border-radius: 25px;
-                font-size: 18px;
-            }}
-            QLineEdit:focus {{
-                border: 2px solid {self.COLOR_PRIMARIO_HOVER};
-                background-color: #353B4F;
-            }}
-        """)
+        campo.setObjectName("campo_busqueda")
         
         # Conectar eventos (se implementan en la clase derivada)
         campo.textChanged.connect(self.on_texto_cambiado)
@@ -138,22 +227,7 @@ class VentanaBase(QMainWindow):
         """
         boton = QPushButton("BUSCAR")
         boton.setFixedSize(140, 50)
-        boton.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.COLOR_PRIMARIO};
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                border: none;
-                border-radius: 25px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.COLOR_PRIMARIO_HOVER};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.COLOR_PRIMARIO_PRESSED};
-            }}
-        """)
+        boton.setObjectName("btn_buscar")
         boton.setCursor(Qt.PointingHandCursor)
         boton.clicked.connect(self.buscar_archivos)
         
@@ -168,13 +242,7 @@ class VentanaBase(QMainWindow):
         """
         panel = QFrame()
         panel.setFixedWidth(self.PANEL_USB_ANCHO)
-        panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: rgba(227, 45, 100, 0.3);
-                border: 2px solid {self.COLOR_PRIMARIO};
-                border-radius: 20px;
-            }}
-        """)
+        panel.setObjectName("panel_unidades")
         
         vbox = QVBoxLayout(panel)
         vbox.setContentsMargins(15, 15, 15, 15)
@@ -183,16 +251,7 @@ class VentanaBase(QMainWindow):
         # Título del panel
         titulo = QLabel("UNIDADES USB")
         titulo.setAlignment(Qt.AlignCenter)
-        titulo.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 10px;
-                background-color: rgba(0, 0, 0, 0.3);
-                border-radius: 10px;
-            }
-        """)
+        titulo.setObjectName("titulo_unidades")
         vbox.addWidget(titulo)
         
         # Layout dinámico donde se agregarán los botones de unidades
@@ -213,46 +272,38 @@ class VentanaBase(QMainWindow):
         - Selección y hover con efectos visuales
         """
         panel = QFrame()
-        panel.setStyleSheet(f"""
-            QFrame {{ 
-                background-color: rgba(43, 49, 63, 0.8); 
-                border: 2px solid {self.COLOR_PRIMARIO};
-                border-radius: 20px; 
-            }}
-        """)
+        panel.setObjectName("panel_resultados")
         
         vbox = QVBoxLayout(panel)
         vbox.setContentsMargins(20, 20, 20, 20)
         
-        # Lista de resultados con estilo personalizado
-        self.results_list = QListWidget()
-        self.results_list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: transparent;
-                color: white;
-                font-family: 'Segoe UI', Arial;
-                font-size: 20px;
-                font-weight: bold;
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item {{
-                padding: 8px;
-                border-radius: 5px;
-                margin: 2px;
-            }}
-            QListWidget::item:selected {{ 
-                background-color: {self.COLOR_PRIMARIO};
-                color: white;
-            }}
-            QListWidget::item:hover {{
-                background-color: rgba(227, 45, 100, 0.3);
-            }}
-        """)
+        # Lista de resultados (estilo en HOJA_ESTILOS)
+        self.results_list = self._crear_lista_resultados()
+        self.results_list.setObjectName("lista_resultados")
         
         vbox.addWidget(self.results_list)
         parent.addWidget(panel, 1)  # Factor de expansión 1
     
+    def _crear_lista_resultados(self) -> QListView:
+        """
+        Lista de resultados virtual sobre ModeloResultados.
+        
+        La vista solo pide al modelo las filas visibles, así que se muestran
+        todos los resultados sin crear un item por archivo.
+        """
+        self.modelo_resultados = ModeloResultados(self)
+        
+        lista = QListView()
+        lista.setModel(self.modelo_resultados)
+        lista.setUniformItemSizes(True)
+        # Con cientos de miles de filas, la vista calcula sus posiciones
+        # por tandas sin bloquear la interfaz
+        lista.setLayoutMode(QListView.Batched)
+        lista.setBatchSize(self.TANDA_DISPOSICION)
+        lista.setEditTriggers(QListView.NoEditTriggers)
+        lista.doubleClicked.connect(self.abrir_item)
+        return lista
+    
     # ========== Métodos abstractos (deben implementarse en clase derivada) ==========
     
     def on_texto_cambiado(self):
@@ -275,6 +326,10 @@ class VentanaBase(QMainWindow):
         """Cambia el tipo de búsqueda activo."""
         pass
     
+    def abrir_item(self, item):
+        """Abre el archivo de la fila de resultados con doble clic."""
+        pass
+    
     def mostrar_mensaje_inicial(self):
         """Muestra el mensaje inicial en la lista de resultados."""
         pass
\ No newline at end of file
@@ -17,6 +17,67 @@ class VentanaInstrucciones(QMainWindow):
     - Se puede cerrar con botón o tecla X
     """
     
+    # Instrucciones en HTML (contenido fijo)
+    HTML_INSTRUCCIONES = """
+        <div style='font-family: Segoe UI; font-size: 20px; line-height: 1.8; color: white;'>
+            
+            
+            <h3 style='color: #E32D64; margin-top: 20px;'> Detección Automática:</h3>
+            <ul style='padding-left: 20px;'>
+                <li><b>Búsqueda por nombre:</b> Escribe texto normal<br>
+                    <i style='color: #aaa;'>Ejemplo: "documento", "foto", "informe"</i></li>
+                
+                <li style='margin-top: 10px;'><b>Búsqueda por extensión:</b> Empieza con punto<br>
+                    <i style='color: #aaa;'>Ejemplo: ".pdf", ".txt", ".jpg"</i></li>
+
+                <li style='margin-top: 10px;'><b>Búsqueda por contenido:</b> Empieza con @<br>
+                    <i style='color: #aaa;'>Ejemplo: "@Lizandro", "@JAVA", "@SQL"</i></li>
+            </ul>
+        </div>
+    """
+    
+    # Estilos de todos los componentes; cada regla se aplica por nombre de objeto
+    HOJA_ESTILOS = """
+        /* Fondo */
+        QMainWindow {
+            background-color: qlineargradient(
+                x1: 0, y1: 0, x2: 0, y2: 1,
+                stop: 0 #161239,
+                stop: 1 #2B313F
+            );
+        }
+        
+        /* Título */
+        QLabel#titulo_instrucciones {
+            color: #E32D64;
+            padding: 10px;
+        }
+        
+        /* Área de instrucciones */
+        QTextEdit#area_instrucciones {
+            background-color: #2B313F;
+            border: 2px solid #E32D64;
+            border-radius: 15px;
+            padding: 15px;
+        }
+        
+        /* Botón cerrar */
+        QPushButton#btn_cerrar {
+            background-color: #E32D64;
+            color: white;
+            font-size: 16px;
+            font-weight: bold;
+            border: none;
+            border-radius: 22px;
+        }
+        QPushButton#btn_cerrar:hover {
+            background-color: #FF3D7F;
+        }
+        QPushButton#btn_cerrar:pressed {
+            background-color: #C02556;
+        }
+    """
+    
     def __init__(self, parent=None):
         """
         Inicializa la ventana de instrucciones.
@@ -53,7 +114,7 @@ class VentanaInstrucciones(QMainWindow):
         layout.addWidget(self._crear_area_instrucciones())
         layout.addWidget(self._crear_boton_cerrar())
         
-        # Aplicar estilo de fondo
+        # Una sola hoja de estilos para toda la ventana
         self._aplicar_estilos()
     
     def _crear_titulo(self) -> QLabel:
@@ -66,7 +127,7 @@ class VentanaInstrucciones(QMainWindow):
         titulo = QLabel("Bienvenido al Buscador de Archivos")
         titulo.setAlignment(Qt.AlignCenter)
         titulo.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        titulo.setStyleSheet("color: #E32D64; padding: 10px;")
+        titulo.setObjectName("titulo_instrucciones")
         return titulo
     
     def _crear_area_instrucciones(self) -> QTextEdit:
@@ -78,42 +139,10 @@ class VentanaInstrucciones(QMainWindow):
         """
         texto = QTextEdit()
         texto.setReadOnly(True)
-        texto.setHtml(self._obtener_html_instrucciones())
-        texto.setStyleSheet("""
-            QTextEdit {
-                background-color: #2B313F;
-                border: 2px solid #E32D64;
-                border-radius: 15px;
-                padding: 15px;
-            }
-        """)
+        texto.setHtml(self.HTML_INSTRUCCIONES)
+        texto.setObjectName("area_instrucciones")
         return texto
     
-    def _obtener_html_instrucciones(self) -> str:
-        """
-        Retorna el HTML con las instrucciones formateadas.
-        
-        Returns:
-            String con HTML de instrucciones
-        """
-        return """
-            <div style='font-family: Segoe UI; font-size: 20px; line-height: 1.8; color: white;'>
-                
-                
-                <h3 style='color: #E32D64; margin-top: 20px;'> Detección Automática:</h3>
-                <ul style='padding-left: 20px;'>
-                    <li><b>Búsqueda por nombre:</b> Escribe texto normal<br>
-                        <i style='color: #aaa;'>Ejemplo: "documento", "foto", "informe"</i></li>
-                    
-                    <li style='margin-top: 10px;'><b>Búsqueda por extensión:</b> Empieza con punto<br>
-                        <i style='color: #aaa;'>Ejemplo: ".pdf", ".txt", ".jpg"</i></li>
-
-                    <li style='margin-top: 10px;'><b>Búsqueda por contenido:</b> Empieza con @<br>
-                        <i style='color: #aaa;'>Ejemplo: "@Lizandro", "@JAVA", "@SQL"</i></li>
-                </ul>
-            </div>
-        """
-    
     def _crear_boton_cerrar(self) -> QPushButton:
         """
         Crea el botón para cerrar la ventana.
@@ -123,43 +152,23 @@ class VentanaInstrucciones(QMainWindow):
         """
         btn_cerrar = QPushButton("¡Entendido!")
         btn_cerrar.setFixedHeight(45)
-        btn_cerrar.setStyleSheet("""
-            QPushButton {
-                background-color: #E32D64;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                border: none;
-                border-radius: 22px;
-            }
-            QPushButton:hover {
-                background-color: #FF3D7F;
-            }
-            QPushButton:pressed {
-                background-color: #C02556;
-            }
-        """)
+        btn_cerrar.setObjectName("btn_cerrar")
         btn_cerrar.setCursor(Qt.PointingHandCursor)
         btn_cerrar.clicked.connect(self.close)
         return btn_cerrar
     
     def _aplicar_estilos(self):
-        """Aplica los estilos de fondo a la ventana."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: qlineargradient(
-                    x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #161239,
-                    stop: 1 #2B313F
-                );
-            }
-        """)
+        """Aplica la hoja de estilos a la ventana, ya con todos sus componentes."""
+        self.setStyleSheet(self.HOJA_ESTILOS)
     
     def mostrar(self):
         """
         Muestra la ventana al frente y la activa.
         Método de conveniencia para mostrar la ventana correctamente.
+        Si ya está visible y activa, no hace nada.
         """
-        self.show()
-        self.raise_()
-        self.activateWindow()
\ No newline at end of file
+        if not self.isVisible():
+            self.show()
+        if not self.isActiveWindow():
+            self.raise_()
+            self.activateWindow()
\ No newline at end of file